@@ -1,12 +1,42 @@
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import hashlib
+import json
 import logging
-import re
+import math
 import requests
-from typing import Optional, List, Dict, Union
-from requests.exceptions import RequestException, HTTPError, Timeout
+import threading
+from types import MappingProxyType
+from typing import Callable, Iterable, Optional, List, Dict, Union
+from requests.adapters import HTTPAdapter
+from requests.exceptions import (
+    RequestException,
+    HTTPError,
+    InvalidJSONError,
+    Timeout,
+)
+from urllib3.util.retry import Retry
 
 from sdxlib.sdx_exception import SDXException
 from sdxlib.sdx_response import SDXResponse
+from sdxlib.sdx_validators import (
+    PORT_ID_PATTERN,
+    is_valid_email,
+    is_valid_iso8601,
+    is_valid_port_id,
+    validate_endpoint_dict,
+    validate_endpoints,
+    validate_notifications,
+    validate_qos_metric,
+    validate_qos_metric_value,
+    validate_scheduling,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
 
 """sdxlib
 
@@ -14,6 +44,239 @@ A Python client library for interacting with the AtlanticWave-SDX L2VPN API.
 """
 
 
+_L2VPN_STATES = frozenset({"enabled", "disabled"})
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Maximum number of create_l2vpn responses remembered per client.
+_REQUEST_CACHE_MAX = 1024
+
+# L2VPN attributes a create_l2vpn_batch spec may set; connection settings
+# (base_url, session, logger) always come from the batch's own client.
+_BATCH_SPEC_KEYS = frozenset(
+    {"name", "endpoints", "description", "notifications", "scheduling", "qos_metrics"}
+)
+
+# update_l2vpn keyword arguments an update_l2vpn_batch item may pass.
+_BATCH_UPDATE_KEYS = _BATCH_SPEC_KEYS | {"service_id", "state"}
+
+# Log/exception wording and status-code messages for each API call.
+# - failure: prefix for HTTP error responses.
+# - request_error: prefix for other request failures.
+# - timeout: message for timed-out requests.
+# - method_messages: read-only status code to message mapping, shared by every
+#   SDXException raised for the call.
+# - error_from_body: take the error message from the response 'description'.
+_ApiCall = namedtuple(
+    "_ApiCall",
+    ["failure", "request_error", "timeout", "method_messages", "error_from_body"],
+)
+
+_CREATE_CALL = _ApiCall(
+    failure="Failed to create L2VPN",
+    request_error="An error occurred while creating L2VPN",
+    timeout="The request to create the L2VPN timed out.",
+    method_messages=MappingProxyType(
+        {
+            201: "L2VPN Service Created",
+            400: "Request does not have a valid JSON or body is incomplete/incorrect",
+            401: "Not Authorized",
+            402: "Request not compatible (e.g., P2MP L2VPN requested, but only P2P supported)",
+            409: "L2VPN Service already exists",
+            410: "Can't fulfill the strict QoS requirements",
+            411: "Scheduling not possible",
+            422: "Attribute not supported by the SDX-LC/OXPO",
+        }
+    ),
+    error_from_body=False,
+)
+
+_UPDATE_CALL = _ApiCall(
+    failure="Failed to update L2VPN",
+    request_error="Failed to update L2VPN",
+    timeout="The request to update the L2VPN timed out.",
+    method_messages=MappingProxyType(
+        {
+            201: "L2VPN Service Modified",
+            400: "Request does not have a valid JSON or body is incomplete/incorrect",
+            401: "Not Authorized",
+            402: "Request not compatible (e.g., P2MP L2VPN requested, but only P2P supported)",
+            404: "L2VPN Service ID not found",
+            409: "Conflicts with a different L2VPN",
+            410: "Can't fulfill the strict QoS requirements",
+            411: "Scheduling not possible",
+        }
+    ),
+    error_from_body=False,
+)
+
+_GET_CALL = _ApiCall(
+    failure="Failed to retrieve L2VPN",
+    request_error="Failed to retrieve L2VPN",
+    timeout="The request to retrieve the L2VPN timed out.",
+    method_messages=MappingProxyType(
+        {
+            200: "OK",
+            401: "Not Authorized",
+            404: "Service ID not found",
+        }
+    ),
+    error_from_body=False,
+)
+
+_GET_ALL_CALL = _ApiCall(
+    failure="Failed to retrieve L2VPNs",
+    request_error="Failed to retrieve L2VPN(s)",
+    timeout="The request to retrieve the L2VPNs timed out.",
+    method_messages=MappingProxyType(
+        {
+            200: "OK",
+        }
+    ),
+    error_from_body=False,
+)
+
+_DELETE_CALL = _ApiCall(
+    failure="Failed to delete L2VPN",
+    request_error="Failed to delete L2VPN",
+    timeout="The request to delete the L2VPN timed out.",
+    method_messages=MappingProxyType(
+        {
+            201: "L2VPN Deleted",
+            401: "Not Authorized",
+            404: "L2VPN Service ID provided does not exist",
+        }
+    ),
+    error_from_body=True,
+)
+
+
+def _has_non_finite(value) -> bool:
+    """Reports whether a payload value holds a NaN or infinite float anywhere."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+
+def _json_dumps(payload: Dict) -> bytes:
+    """Serializes a request payload to UTF-8 JSON bytes, using orjson when installed.
+
+    Raises:
+        InvalidJSONError: If the payload cannot be serialized or holds a NaN or
+            infinite float, as requests raises for its own json= argument.
+    """
+    try:
+        if orjson is not None:
+            # orjson writes non-finite floats as null instead of rejecting them.
+            if _has_non_finite(payload):
+                raise ValueError("Out of range float values are not JSON compliant")
+            return orjson.dumps(payload)
+        return json.dumps(
+            payload, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+        ).encode()
+    except (TypeError, ValueError) as e:
+        raise InvalidJSONError(e) from e
+
+
+def _normalize_state(state: str) -> str:
+    """Returns an L2VPN state in lower case, rejecting anything but 'enabled' or 'disabled'."""
+    if isinstance(state, str) and state.lower() in _L2VPN_STATES:
+        return state.lower()
+    raise ValueError(
+        "Invalid state value. The 'state' attribute can only by changed to 'enabled' or 'disabled'."
+    )
+
+
+def _check_batch_update(update: Dict) -> None:
+    """Validates one update_l2vpn_batch item before any request is sent."""
+    if not isinstance(update, dict):
+        raise TypeError("Each L2VPN update must be a dictionary.")
+    unsupported = update.keys() - _BATCH_UPDATE_KEYS
+    if unsupported:
+        raise ValueError(
+            f"Unsupported L2VPN update keys: {', '.join(sorted(unsupported))}."
+        )
+    if "service_id" not in update:
+        raise ValueError("Each L2VPN update requires a service_id.")
+    if update.get("state") is not None:
+        _normalize_state(update["state"])
+
+
+def _run_batch(
+    call: Callable, items: Iterable, max_workers: int
+) -> List[Union[SDXResponse, SDXException]]:
+    """Calls call on each item concurrently, returning the results in input order.
+
+    An SDXException raised for an item is returned in its place, so one failed
+    request does not discard the results of the others.
+    """
+
+    def call_or_error(item):
+        try:
+            return call(item)
+        except SDXException as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(call_or_error, items))
+
+
+def _default_session() -> requests.Session:
+    """Builds the session shared by clients that are not given one.
+
+    The mounted adapter keeps up to 50 pooled connections per host, enough for
+    several clients running batch calls at once, and retries idempotent
+    requests (urllib3's default method set excludes POST and PATCH) on
+    connection errors and 502/503/504 responses. Read timeouts are never
+    retried: the request may already have been applied, and the timeout must
+    reach the caller as requests.Timeout rather than a ConnectionError.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        # raise_on_status=False hands the last response back so raise_for_status()
+        # still reports the real status code once retries are exhausted.
+        max_retries=Retry(
+            total=3,
+            # read=False re-raises read timeouts as-is; read=0 would still wrap
+            # them in MaxRetryError, which requests reports as ConnectionError.
+            read=False,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept"] = "application/json"
+    return session
+
+
+# Clients created without a session share this one, so they reuse each other's
+# keep-alive connections to the SDX controller.
+_SESSION = _default_session()
+
+
+def _json_loads(response: requests.Response):
+    """Decodes a response body as JSON, parsing the raw bytes with orjson when installed.
+
+    Falls back to response.json() when orjson is unavailable or rejects the
+    body, so non-UTF-8 and malformed bodies behave exactly as before.
+    """
+    content = response.content
+    if orjson is None or not isinstance(content, bytes):
+        return response.json()
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return response.json()
+
+
 class SDXClient:
     """A client class for managing interactions
         with the AtlanticWave-SDX L2VPN API.
@@ -28,10 +291,24 @@ class SDXClient:
     - SDXException: If an API request fails.
     """
 
-    PORT_ID_PATTERN = (
-        r"^urn:sdx:port:[a-zA-Z0-9.,-_\/]+:[a-zA-Z0-9.,-_\/]+:[a-zA-Z0-9.,-_\/]+$"
+    __slots__ = (
+        "_base_url",
+        "_l2vpn_url",
+        "_l2vpn_prefix",
+        "_name",
+        "_endpoints",
+        "_description",
+        "_notifications",
+        "_scheduling",
+        "_qos_metrics",
+        "_logger",
+        "_request_cache",
+        "_cache_lock",
+        "_session",
     )
 
+    PORT_ID_PATTERN = PORT_ID_PATTERN
+
     VERSION = "1.0"
 
     def __init__(
@@ -44,6 +321,7 @@ class SDXClient:
         scheduling: Optional[Dict[str, str]] = None,
         qos_metrics: Optional[Dict[str, Dict[str, Union[int, bool]]]] = None,
         logger: Optional[logging.Logger] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """Initializes an instance of SDXClient.
 
@@ -55,8 +333,13 @@ class SDXClient:
         - notifications (Optional[List[Dict[str, str]]]): List of dictionaries, each with a single 'email' key (default: None).
         - scheduling (Optional[Dict[str, str]]): Scheduling configuration (default: None).
         - qos_metrics (Optional[Dict[str, str]]): Quality of service metrics (default: None).
+        - logger (Optional[logging.Logger]): Logger to use (default: module logger).
+        - session (Optional[requests.Session]): Session used for all API calls, e.g. one with a
+            custom transport adapter mounted (default: a pooled, retrying session shared
+            by all clients).
         """
         self._base_url = base_url
+        self._cache_l2vpn_urls()
         self._name = name
         self._endpoints = endpoints
         self._description = description
@@ -64,7 +347,9 @@ class SDXClient:
         self._scheduling = scheduling
         self._qos_metrics = qos_metrics
         self._logger = logger or logging.getLogger(__name__)
-        self._request_cache = {}
+        self._request_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._session = session or _SESSION
 
     @property
     def base_url(self) -> str:
@@ -77,6 +362,12 @@ class SDXClient:
         if not isinstance(value, str) or not value.strip():
             raise ValueError("Base URL must be a non-empty string.")
         self._base_url = value
+        self._cache_l2vpn_urls()
+
+    def _cache_l2vpn_urls(self) -> None:
+        """Precomputes the L2VPN collection URL and per-service URL prefix."""
+        self._l2vpn_url = f"{self._base_url}/l2vpn/{self.VERSION}"
+        self._l2vpn_prefix = self._l2vpn_url + "/"
 
     @property
     def name(self) -> Optional[str]:
@@ -96,8 +387,12 @@ class SDXClient:
 
     @property
     def endpoints(self) -> Optional[List[Dict[str, str]]]:
-        """Getter for endpoint attribute."""
-        return self._endpoints
+        """Getter for endpoint attribute.
+
+        Returns a copy, so changes to it only take effect (and are validated)
+        when assigned back.
+        """
+        return None if self._endpoints is None else list(self._endpoints)
 
     @endpoints.setter
     def endpoints(self, value: Optional[List[Dict[str, str]]]):
@@ -121,8 +416,12 @@ class SDXClient:
 
     @property
     def notifications(self) -> Optional[List[Dict[str, str]]]:
-        """Getter for notifications attribute."""
-        return self._notifications
+        """Getter for notifications attribute.
+
+        Returns a copy, so changes to it only take effect (and are validated)
+        when assigned back.
+        """
+        return None if self._notifications is None else list(self._notifications)
 
     @notifications.setter
     def notifications(self, value: Optional[List[Dict[str, str]]]):
@@ -165,307 +464,16 @@ class SDXClient:
         self._validate_qos_metric(value)
         self._qos_metrics = value
 
-    # Endpoints Methods
-    def _validate_endpoints(
-        self, endpoints: Optional[List[Dict[str, str]]]
-    ) -> List[Dict[str, str]]:
-        """Validates the provided list of endpoints.
-
-        Args:
-            endpoints (Optional[List[Dict[str, str]]]): List of endpoint dictionaries.
-
-        Returns:
-            List[Dict[str, str]]: Validated list of endpoint dictionaries.
-
-        Raises:
-            TypeError: If endpoints is not a list.
-            ValueError: If endpoints list is empty or does not contain at least 2 entries,
-                or if VLAN configuration is invalid.
-        """
-        if endpoints is None:
-            return []
-        if not isinstance(endpoints, list):
-            raise TypeError("Endpoints must be a list.")
-        if len(endpoints) < 2:
-            raise ValueError("Endpoints must contain at least 2 entries.")
-
-        vlans = set()
-        vlan_ranges = set()
-        special_vlans = {"any", "all", "untagged"}
-        has_vlan_range = False
-        has_single_vlan = False
-        has_special_vlan = False
-        has_any_untagged = False
-
-        validated_endpoints = []
-        for endpoint in endpoints:
-            validated_endpoint = self._validate_endpoint_dict(endpoint)
-            validated_endpoints.append(validated_endpoint)
-
-            vlan_value = endpoint["vlan"]
-            if vlan_value in special_vlans:
-                vlans.add(vlan_value)
-                if vlan_value in {"any", "untagged"}:
-                    has_any_untagged = True
-                else:
-                    has_special_vlan = True
-            elif vlan_value.isdigit():
-                has_single_vlan = True
-                vlans.add(vlan_value)
-            elif ":" in vlan_value:
-                vlan_ranges.add(vlan_value)
-                has_vlan_range = True
-
-            # Check VLAN consistency across endpoints.
-            if has_vlan_range and (
-                len(vlan_ranges) > 1
-                or has_single_vlan
-                or has_special_vlan
-                or has_any_untagged
-            ):
-                raise ValueError(
-                    "All endpoints must have the same VLAN value if one endpoint is 'all' or a range."
-                )
-
-            if has_special_vlan and (
-                len(vlans) > 1 or has_single_vlan or has_vlan_range
-            ):
-                raise ValueError(
-                    "All endpoints must have the same VLAN value if one endpoint is 'all' or a range."
-                )
-
-        return validated_endpoints
-
-    def _validate_endpoint_dict(self, endpoint_dict: Dict[str, str]) -> Dict[str, str]:
-        """Validates a single endpoint dictionary.
-
-        Args:
-            endpoint_dict (Dict[str, str]): Endpoint dictionary.
-
-        Returns:
-            Dict[str, str]: Validated endpoint dictionary.
-
-        Raises:
-            TypeError: If endpoint_dict is not a dictionary.
-            ValueError: If endpoint_dict does not contain required keys or VLAN is invalid.
-        """
-        if not isinstance(endpoint_dict, dict):
-            raise TypeError("Endpoints must be a list of dictionaries.")
-
-        # Validate 'port_id'
-        if "port_id" not in endpoint_dict or not endpoint_dict["port_id"]:
-            raise ValueError("Each endpoint must contain a non-empty 'port_id' key.")
-        if not re.match(self.PORT_ID_PATTERN, endpoint_dict["port_id"]):
-            raise ValueError(f"Invalid port_id format: {endpoint_dict['port_id']}")
-
-        # Validate 'vlan'
-        if "vlan" not in endpoint_dict or not endpoint_dict["vlan"]:
-            raise ValueError("Each endpoint must contain a non-empty 'vlan' key.")
-        vlan_value = endpoint_dict["vlan"]
-
-        if not isinstance(vlan_value, str):
-            raise TypeError("VLAN must be a string.")
-
-        valid_vlans = {"any", "all", "untagged"}
-
-        if vlan_value in valid_vlans:
-            pass  # Valid special VLAN value
-        elif vlan_value.isdigit():
-            vlan_int = int(vlan_value)
-            if not (1 <= vlan_int <= 4095):
-                raise ValueError(
-                    f"Invalid VLAN value: '{vlan_value}'. Must be between 1 and 4095."
-                )
-        elif ":" in vlan_value:
-            vlan_range = vlan_value.split(":")
-            if len(vlan_range) != 2:
-                raise ValueError(
-                    f"Invalid VLAN range values: '{vlan_value}'. Must be 'VLAN ID1:VLAN ID2'."
-                )
-            try:
-                vlan_id1, vlan_id2 = map(int, vlan_range)
-                if not (1 <= vlan_id1 < vlan_id2 <= 4095):
-                    raise ValueError(
-                        f"Invalid VLAN range values: '{vlan_value}'. Must be between 1 and 4095, and VLAN ID1 must be less than VLAN ID2."
-                    )
-            except ValueError:
-                raise ValueError(
-                    f"Invalid VLAN range format: '{vlan_value}'. Must be 'VLAN ID1:VLAN ID2'."
-                )
-        else:
-            raise ValueError(
-                f"Invalid VLAN value: '{vlan_value}'. Must be 'any', 'all', 'untagged', a string representing an integer between 1 and 4095, or a range."
-            )
-
-        return endpoint_dict
-
-    # Notifications Methods
-    @staticmethod
-    def is_valid_email(email: str) -> bool:
-        """Validates an email address format.
-
-        Args:
-            email (str): Email address to validate.
-
-        Returns:
-            bool: True if the email address is valid, False otherwise.
-        """
-        if not isinstance(email, str):
-            return False
-        email_regex = r"^\S+@\S+$"
-        return re.match(email_regex, email) is not None
-
-    def _validate_notifications(
-        self, notifications: Optional[List[Dict[str, str]]]
-    ) -> Optional[List[Dict[str, str]]]:
-        """Validates the notifications attribute.
-
-        Args:
-            notifications (Optional[List[Dict[str, str]]]): List of dictionaries representing notifications.
-
-        Returns:
-            Optional[List[Dict[str, str]]]: Validated list of notifications.
-
-        Raises:
-            TypeError: If notifications is not a list.
-            ValueError: If notifications exceed 10 dictionaries or contain invalid emails.
-        """
-        if notifications is None:
-            return None
-        if not isinstance(notifications, list):
-            raise ValueError("Notifications must be provided as a list.")
-        if len(notifications) > 10:
-            raise ValueError("Notifications can contain at most 10 email addresses.")
-
-        validated_notifications = []
-        for notification in notifications:
-            if not isinstance(notification, dict):
-                raise ValueError("Each notification must be a dictionary.")
-            if "email" not in notification:
-                raise ValueError(
-                    "Each notification dictionary must contain a key 'email'."
-                )
-            if not self.is_valid_email(notification["email"]):
-                raise ValueError(
-                    f"Invalid email address or email format: {notification['email']}"
-                )
-            validated_notifications.append(notification)
-        return validated_notifications
-
-    def _is_valid_iso8601(self, timestamp: str) -> bool:
-        """Checks if the provided string is a valid ISO8601 formatted timestamp.
-
-        Args:
-            timestamp (str): The timestamp to validate.
-
-        Returns:
-            bool: True if the timestamp is valid, False otherwise.
-        """
-        timestamp_pattern = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$"
-        return re.match(timestamp_pattern, timestamp) is not None
-
-    # Scheduling Methods
-    def _validate_scheduling(
-        self, scheduling: Optional[Dict[str, str]]
-    ) -> Optional[Dict[str, str]]:
-        """Validates the provided scheduling configuration.
-
-        Args:
-            scheduling (Optional[Dict[str, str]]): Scheduling configuration.
-
-        Raises:
-            TypeError: If scheduling is not a dictionary and value is not a string.
-            ValueError: If scheduling contains invalid keys or values.
-        """
-        if scheduling is None:
-            return None
-
-        if not isinstance(scheduling, dict):
-            raise TypeError("Scheduling must be a dictionary.")
-
-        valid_keys = {"start_time", "end_time"}
-        for key in scheduling:
-            if key not in valid_keys:
-                raise ValueError(f"Invalid scheduling key: {key}")
-
-            time = scheduling[key]
-            if not isinstance(time, str):
-                raise TypeError(f"{key} must be a string.")
-            if not self._is_valid_iso8601(time):
-                raise ValueError(
-                    f"Invalid '{key}' format. Use ISO8601 format (YYYY-MM-DDTHH:mm:SSZ)."
-                )
-
-        if "start_time" in scheduling and "end_time" in scheduling:
-            if scheduling["end_time"] <= scheduling["start_time"]:
-                raise ValueError("End time must be after start time.")
-
-        return scheduling
-
-    # QOS Metrics Methods
-    def _validate_qos_metric(
-        self, qos_metrics: Optional[Dict[str, Dict[str, Union[int, bool]]]]
-    ) -> None:
-        """Validates the provided quality of service metrics.
-
-        Args:
-            qos_metrics (Optional[Dict[str, Dict[str, Union[int, bool]]]]): Quality of service metrics.
-
-        Raises:
-            TypeError: If qos_metrics is not a dictionary and values are invalid types.
-            ValueError: If qos_metrics contains invalid keys or values.
-        """
-        if qos_metrics is None:
-            return
-
-        if not isinstance(qos_metrics, dict):
-            raise TypeError("QoS metrics must be a dictionary.")
-
-        valid_keys = {"min_bw", "max_delay", "max_number_oxps"}
-        for key, value_dict in qos_metrics.items():
-            if key not in valid_keys:
-                raise ValueError(f"Invalid QoS metric: {key}")
-            if not isinstance(value_dict, dict):
-                raise TypeError(f"QoS metric value for '{key}' must be a dictionary.")
-            self._validate_qos_metric_value(key, value_dict)
-
-    def _validate_qos_metric_value(
-        self, key: str, value_dict: Dict[str, Union[int, bool]]
-    ) -> None:
-        """Validates the value dictionary for a specific QoS metric.
-
-        Args:
-            key (str): The key for the Qos Metric.
-            value_dict (Dict[str, Union[int, bool]]): The value dictionary for the QoS metric.
-
-        Raises:
-            ValueError: If the value for the metric is out of the expected range.
-            TypeError: If value or strict values are of incorrect type.
-        """
-        if "value" not in value_dict:
-            raise ValueError(f"Missing required key 'value' in QoS metric for '{key}'")
-        if not isinstance(value_dict["value"], int):
-            raise TypeError("QoS value for '{key}' must be an integer.")
-        if "strict" in value_dict and not isinstance(value_dict["strict"], bool):
-            raise TypeError(f"'strict' in QoS metric of '{key}' must be a boolean.")
-
-        # Specific range checks for each key
-        if key == "min_bw":
-            if not 0 <= value_dict["value"] <= 100:
-                raise ValueError("qos_metric 'min_bw' value must be between 0 and 100.")
-        elif key == "max_delay":
-            if not 0 <= value_dict["value"] <= 1000:
-                raise ValueError(
-                    "qos_metric 'max_delay' value must be between 0 and 1000."
-                )
-        elif key == "max_number_oxps":
-            if not 1 <= value_dict["value"] <= 100:
-                raise ValueError(
-                    "qos_metric 'max_number_oxps' value must be between 1 and 100."
-                )
-
-        # 'strict' key validation (default False)
-        value_dict.get("strict", False)
+    # Attribute validators, implemented in sdxlib.sdx_validators.
+    _validate_endpoints = staticmethod(validate_endpoints)
+    _validate_endpoint_dict = staticmethod(validate_endpoint_dict)
+    _is_valid_port_id = staticmethod(is_valid_port_id)
+    is_valid_email = staticmethod(is_valid_email)
+    _validate_notifications = staticmethod(validate_notifications)
+    _is_valid_iso8601 = staticmethod(is_valid_iso8601)
+    _validate_scheduling = staticmethod(validate_scheduling)
+    _validate_qos_metric = staticmethod(validate_qos_metric)
+    _validate_qos_metric_value = staticmethod(validate_qos_metric_value)
 
     ### SDX Client Methods
     def create_l2vpn(self) -> SDXResponse:
@@ -484,73 +492,136 @@ class SDXClient:
             )
         if not isinstance(self._endpoints, list):
             raise TypeError("Endpoints must be a list.")
-        url = f"{self.base_url}/l2vpn/{self.VERSION}"
+        url = self._l2vpn_url
 
         # Old url that we are currently working under
         # url = f"{self.base_url}/SDX-Controller/1.0.0/connection"
 
-        payload = {"name": self._name, "endpoints": self._endpoints}
-
-        # Add optional attributes if provided.
-        if self._description:
-            payload["description"] = self._description
-        if self._notifications:
-            payload["notifications"] = self._notifications
-        if self._scheduling:
-            payload["scheduling"] = self._scheduling
-        if self._qos_metrics:
-            payload["qos_metrics"] = self._qos_metrics
+        payload = self._create_payload()
 
         self._logger.debug("Sending request to create L2VPN with payload: %s", payload)
 
-        # Check cache for existing request with same name and endpoints
-        cache_key = (
-            self._name,
-            tuple(endpoint["port_id"] for endpoint in self._endpoints),
-        )
-        cached_data = self._request_cache.get(cache_key)
-
-        if cached_data:
-            _, response_json = cached_data
-            return SDXResponse(response_json)
-
-        try:
-            response = requests.post(url, json=payload, timeout=120)
+        with self._api_errors(_CREATE_CALL):
+            # The serialized body identifies the request, so an identical create
+            # returns the cached response instead of being sent again.
+            body = _json_dumps(payload)
+            cache_key = hashlib.blake2b(body, digest_size=16).digest()
+            cached_json = self._cache_get(cache_key)
+            if cached_json is not None:
+                return SDXResponse(cached_json)
+
+            response = self._session.post(
+                url, data=body, headers=_JSON_HEADERS, timeout=120
+            )
             response.raise_for_status()
-            response_json = response.json()
-            cached_data = (payload, response_json)
-            self._request_cache[cache_key] = cached_data
+            response_json = _json_loads(response)
+            self._cache_put(cache_key, response_json)
             self._logger.info(
-                f"L2VPN created successfully with service_id: {response_json['service_id']}"
+                "L2VPN created successfully with service_id: %s",
+                response_json["service_id"],
             )
             return SDXResponse(response_json)
-        except HTTPError as e:
-            status_code = e.response.status_code
-            method_messages = {
-                201: "L2VPN Service Created",
-                400: "Request does not have a valid JSON or body is incomplete/incorrect",
-                401: "Not Authorized",
-                402: "Request not compatible (e.g., P2MP L2VPN requested, but only P2P supported)",
-                409: "L2VPN Service already exists",
-                410: "Can't fulfill the strict QoS requirements",
-                411: "Scheduling not possible",
-                422: "Attribute not supported by the SDX-LC/OXPO",
-            }
-            error_message = method_messages.get(status_code, "Unknown error occurred.")
-            self._logger.error(
-                f"Failed to create L2VPN. Status code: {status_code}: {error_message}"
+
+    def _create_payload(self) -> Dict:
+        """Builds the create_l2vpn request payload from the client's attributes."""
+        # Name and endpoints are required; optional attributes are sent only if set.
+        return {
+            key: value
+            for key, value in (
+                ("name", self._name),
+                ("endpoints", self._endpoints),
+                ("description", self._description),
+                ("notifications", self._notifications),
+                ("scheduling", self._scheduling),
+                ("qos_metrics", self._qos_metrics),
             )
-            raise SDXException(
-                status_code=status_code,
-                method_messages=method_messages,
-                message=error_message,
+            if value
+        }
+
+    def _cache_get(self, key: bytes) -> Optional[Dict]:
+        """Returns the cached create response for key, marking it most recently used."""
+        # Batch creates share this cache across worker threads.
+        with self._cache_lock:
+            cached_json = self._request_cache.get(key)
+            if cached_json is not None:
+                self._request_cache.move_to_end(key)
+            return cached_json
+
+    def _cache_put(self, key: bytes, response_json: Dict) -> None:
+        """Caches a create response, evicting the least recently used one when full."""
+        with self._cache_lock:
+            self._request_cache[key] = response_json
+            if len(self._request_cache) > _REQUEST_CACHE_MAX:
+                self._request_cache.popitem(last=False)
+
+    def create_l2vpn_batch(
+        self, specs: List[Dict], max_workers: int = 8
+    ) -> List[Union[SDXResponse, SDXException]]:
+        """Creates several L2VPNs concurrently over this client's session.
+
+        Args:
+            specs (List[Dict]): One dictionary of L2VPN attributes per L2VPN, using the
+                SDXClient keyword names (name, endpoints, description, notifications,
+                scheduling, qos_metrics).
+            max_workers (int): Maximum number of requests in flight at once (default: 8).
+
+        Returns:
+            List[Union[SDXResponse, SDXException]]: One result per spec, in input order.
+                Failed creations are returned as their SDXException instead of raised.
+                Specs matching an L2VPN this client already created are answered from
+                its request cache without a request, and identical specs are sent
+                once and share its result.
+
+        Raises:
+            TypeError: If a spec is not a dictionary or has an attribute of the wrong type.
+            ValueError: If a spec uses an unsupported key, is missing the name or
+                endpoints, or has an invalid attribute, or if the base URL is not set.
+                Every spec is validated before any request is sent.
+        """
+        clients = [self._client_for_spec(spec) for spec in specs]
+
+        # Specs with the same serialized body would all miss the cache at once,
+        # so each distinct body is sent once and its result shared.
+        keys = []
+        for client in clients:
+            try:
+                keys.append(_json_dumps(client._create_payload()))
+            except InvalidJSONError:
+                # create_l2vpn reports this spec's error on its own.
+                keys.append(client)
+        distinct = {}
+        for key, client in zip(keys, clients):
+            distinct.setdefault(key, client)
+        results = dict(
+            zip(
+                distinct,
+                _run_batch(SDXClient.create_l2vpn, distinct.values(), max_workers),
             )
-        except Timeout:
-            self._logger.error("The request to create the L2VPN timed out.")
-            raise SDXException(message="The request to create the L2VPN timed out.")
-        except RequestException as e:
-            self._logger.error(f"An error occurred while creating L2VPN: {e}")
-            raise SDXException(message=f"An error occurred while creating L2VPN: {e}")
+        )
+        return [results[key] for key in keys]
+
+    def _client_for_spec(self, spec: Dict) -> "SDXClient":
+        """Builds a client for one batch spec, validating it through the property setters."""
+        if not isinstance(spec, dict):
+            raise TypeError("Each L2VPN spec must be a dictionary.")
+        unsupported = spec.keys() - _BATCH_SPEC_KEYS
+        if unsupported:
+            raise ValueError(
+                f"Unsupported L2VPN spec keys: {', '.join(sorted(unsupported))}."
+            )
+        client = SDXClient(
+            base_url=self._base_url, logger=self._logger, session=self._session
+        )
+        for attr, value in spec.items():
+            setattr(client, attr, value)
+        if not client._base_url or not client._name or not client._endpoints:
+            raise ValueError(
+                "Creating L2VPN requires the base URL, name, and endpoints at minumum."
+            )
+        client._request_cache = self._request_cache
+        client._cache_lock = self._cache_lock
+        return client
+
 ## Potential update to the update_l2vpn method, needs to be evaluated against the spec
 
     # def update_l2vpn(self, service_id: str, state: Optional[str] = None, name: Optional[str] = None,
@@ -656,17 +727,12 @@ class SDXClient:
             ValueError: If any parameter is invalid.
         """
 
-        url = f"{self.base_url}/l2vpn/{self.VERSION}/{service_id}"
+        url = f"{self._l2vpn_prefix}{service_id}"
 
         payload = {"service_id": service_id}
 
         if state is not None:
-            if state.lower() in ["enabled", "disabled"]:
-                payload["state"] = state.lower()
-            else:
-                raise ValueError(
-                    "Invalid state value. The 'state' attribute can only by changed to 'enabled' or 'disabled'."
-                )
+            payload["state"] = _normalize_state(state)
 
         attributes = {
             "name": name,
@@ -681,46 +747,56 @@ class SDXClient:
             if value is not None:
                 payload[attr] = value
     
-        self._logger.debug(f"Sending request to update L2VPN with payload: {payload}")
-
-        try:
-            response = requests.patch(url, json=payload, verify=True, timeout=120)
+        self._logger.debug("Sending request to update L2VPN with payload: %s", payload)
+
+        with self._api_errors(_UPDATE_CALL):
+            body = _json_dumps(payload)
+            response = self._session.patch(
+                url,
+                data=body,
+                headers=_JSON_HEADERS,
+                verify=True,
+                timeout=120,
+            )
             response.raise_for_status()
-            self._logger.info(f"L2VPN update request sent to {url}, with payload: {payload}.")
+            self._logger.info(
+                "L2VPN update request sent to %s, with payload: %s.", url, payload
+            )
             # return response.json()
 
             # No response body on success, so return a success message
             if response.status_code == 201:
-                self._logger.info(f"L2VPN with service_id {service_id} was successfully updated.")
+                self._logger.info(
+                    "L2VPN with service_id %s was successfully updated.", service_id
+                )
                 return SDXResponse({"description": "L2VPN Service Modified", "service_id": service_id})
 
-        except HTTPError as e:
-            status_code = e.response.status_code
-            method_messages = {
-                201: "L2VPN Service Modified",
-                400: "Request does not have a valid JSON or body is incomplete/incorrect",
-                401: "Not Authorized",
-                402: "Request not compatible (e.g., P2MP L2VPN requested, but only P2P supported)",
-                404: "L2VPN Service ID not found",
-                409: "Conflicts with a different L2VPN",
-                410: "Can't fulfill the strict QoS requirements",
-                411: "Scheduling not possible",
-            }
-            error_message = method_messages.get(status_code, "Unknown error occurred.")
-            self._logger.error(
-                f"Failed to update L2VPN. Status code: {status_code}: {error_message}"
-            )
-            raise SDXException(
-                status_code=status_code,
-                method_messages=method_messages,
-                message=error_message,
-            )
-        except Timeout:
-            self._logger.error("Request timed out.")
-            raise SDXException("The request to update the L2VPN timed out.")
-        except RequestException as e:
-            self._logger.error(f"Failed to update L2VPN: {e}")
-            raise SDXException(f"Failed to update L2VPN: {e}")
+    def update_l2vpn_batch(
+        self, updates: List[Dict], max_workers: int = 8
+    ) -> List[Union[SDXResponse, SDXException]]:
+        """Updates several L2VPNs concurrently over this client's session.
+
+        Args:
+            updates (List[Dict]): One dictionary of update_l2vpn keyword arguments per
+                L2VPN, each including its service_id.
+            max_workers (int): Maximum number of requests in flight at once (default: 8).
+
+        Returns:
+            List[Union[SDXResponse, SDXException]]: One result per update, in input order.
+                Failed updates are returned as their SDXException instead of raised.
+
+        Raises:
+            TypeError: If an update is not a dictionary.
+            ValueError: If an update uses a key update_l2vpn does not accept, is
+                missing its service_id, or has an invalid state. Every update is
+                validated before any request is sent.
+        """
+        updates = list(updates)
+        for update in updates:
+            _check_batch_update(update)
+        return _run_batch(
+            lambda update: self.update_l2vpn(**update), updates, max_workers
+        )
 
     def get_l2vpn(self, service_id: str) -> SDXResponse:
         """Retrieves details of an existing L2VPN using the provided service ID.
@@ -736,61 +812,35 @@ class SDXClient:
         """
         # Old url that we are currently working under
         # url = f"{self.base_url}/SDX-Controller/1.0.0/connection/{service_id}"
-        url = f"{self.base_url}/l2vpn/{self.VERSION}/{service_id}"
+        url = f"{self._l2vpn_prefix}{service_id}"
 
-        try:
-            response = requests.get(url, verify=True, timeout=120)
+        with self._api_errors(_GET_CALL):
+            response = self._session.get(url, verify=True, timeout=120)
             response.raise_for_status()
-            response_json = response.json()
-            self._logger.info(f"L2VPN retrieval request sent to {url}.")
+            response_json = _json_loads(response)
+            self._logger.info("L2VPN retrieval request sent to %s.", url)
             
-            # Populate the SDXResponse object with attributes from the response
-            # sdx_response = SDXResponse(
-            #     service_id=response_json.get("service_id"),
-            #     name=response_json.get("name"),
-            #     endpoints=response_json.get("endpoints"),
-            #     description=response_json.get("description"),
-            #     notifications=response_json.get("notifications"),
-            #     qos_metrics=response_json.get("qos_metrics"),
-            #     ownership=response_json.get("ownership"),
-            #     creation_date=response_json.get("creation_date"),
-            #     archived_date=response_json.get("archived_date"),
-            #     status=response_json.get("status"),
-            #     state=response_json.get("state"),
-            #     counters_location=response_json.get("counters_location"),
-            #     last_modified=response_json.get("last_modified"),
-            #     current_path=response_json.get("current_path"),
-            #     oxp_service_ids=response_json.get("oxp_service_ids")
-            # )
-
-            # Directly pass all key-value pairs from response_json to SDXResponse
-            sdx_response = SDXResponse(response_json)
-        
-            return sdx_response            
-            
-            # return response.json()
-        except HTTPError as e:
-            status_code = e.response.status_code
-            method_messages = {
-                200: "OK",
-                401: "Not Authorized",
-                404: "Service ID not found",
-            }
-            error_message = method_messages.get(status_code, "Unknown error occurred.")
-            self._logger.error(
-                f"Failed to retrieve L2VPN. Status code: {status_code}: {error_message}"
-            )
-            raise SDXException(
-                status_code=status_code,
-                method_messages=method_messages,
-                message=error_message,
-            )
-        except Timeout:
-            self._logger.error("Request timed out.")
-            raise SDXException("The request to create the L2VPN timed out.")
-        except RequestException as e:
-            logging.error(f"Failed to retrieve L2VPN: {e}")
-            raise SDXException(f"Failed to retrieve L2VPN: {e}")
+            # The API keys the L2VPN by its service ID; unwrapped bodies are accepted too.
+            if isinstance(response_json, dict) and isinstance(
+                response_json.get(str(service_id)), dict
+            ):
+                return SDXResponse.from_wrapped(response_json)
+            return SDXResponse(response_json)
+
+    def get_l2vpn_batch(
+        self, service_ids: List[str], max_workers: int = 8
+    ) -> List[Union[SDXResponse, SDXException]]:
+        """Retrieves several L2VPNs concurrently over this client's session.
+
+        Args:
+            service_ids (List[str]): The IDs of the L2VPNs to retrieve.
+            max_workers (int): Maximum number of requests in flight at once (default: 8).
+
+        Returns:
+            List[Union[SDXResponse, SDXException]]: One result per service ID, in input order.
+                Failed retrievals are returned as their SDXException instead of raised.
+        """
+        return _run_batch(self.get_l2vpn, service_ids, max_workers)
 
     def get_all_l2vpns(self, archived: bool = False) -> Dict[str, SDXResponse]:
         """
@@ -810,19 +860,20 @@ class SDXClient:
         # url = f"{self.base_url}/SDX-Controller/1.0.0/connections"
 
         if archived:
-            url = f"{self.base_url}/l2vpn/{self.VERSION}/archived"
+            url = self._l2vpn_prefix + "archived"
         else:
-            url = f"{self.base_url}/l2vpn/{self.VERSION}/"
+            url = self._l2vpn_prefix
 
-        self._logger.info(f"Retrieving L2VPNs: URL={url}")
+        self._logger.info("Retrieving L2VPNs: URL=%s", url)
 
-        try:
-            response = requests.get(url, verify=True, timeout=120)
+        with self._api_errors(_GET_ALL_CALL):
+            response = self._session.get(url, verify=True, timeout=120)
             response.raise_for_status()
 
-            l2vpns_json = response.json()
-            self._logger.info(f"L2VPN retrieval request sent to {url}.")
-            self._logger.info(f"Retrieved L2VPNs successfully: {l2vpns_json}")
+            # An empty body means there are no L2VPNs to report.
+            l2vpns_json = _json_loads(response) if response.content else {}
+            self._logger.info("L2VPN retrieval request sent to %s.", url)
+            self._logger.info("Retrieved L2VPNs successfully: %s", l2vpns_json)
 
             # Map each L2VPN in the response JSON to an SDXResponse object
             l2vpns = {
@@ -832,28 +883,6 @@ class SDXClient:
 
             return l2vpns
 
-            # return response.json()
-        except HTTPError as e:
-            status_code = e.response.status_code
-            method_messages = {
-                200: "OK",
-            }
-            error_message = method_messages.get(status_code, "Unknown error occurred.")
-            self._logger.error(
-                f"Failed to retrieve L2VPNs. Status code: {status_code}: {error_message}"
-            )
-            raise SDXException(
-                status_code=status_code,
-                method_messages=method_messages,
-                message=error_message,
-            )
-        except Timeout:
-            self._logger.error("Request timed out.")
-            raise SDXException("The request to create the L2VPN timed out.")
-        except RequestException as e:
-            self._logger.error(f"Failed to retrieve L2VPN(s): {e}")
-            raise SDXException(f"Failed to retrieve L2VPN(s): {e}")
-
     def delete_l2vpn(self, service_id: str) -> Optional[Dict]:
         """Deletes an L2VPN using the provided L2VPN ID.
 
@@ -866,56 +895,83 @@ class SDXClient:
         Raises:
             SDXException: If the API request fails.
         """
-        url = f"{self.base_url}/l2vpn/{self.VERSION}/{service_id}"
+        url = f"{self._l2vpn_prefix}{service_id}"
 
-        try:
-            response = requests.delete(url, verify=True, timeout=120)
+        with self._api_errors(_DELETE_CALL):
+            response = self._session.delete(url, verify=True, timeout=120)
             response.raise_for_status()
-            self._logger.info(f"L2VPN deletion request sent to {url}.")
-            return response.json() if response.content else None
+            self._logger.info("L2VPN deletion request sent to %s.", url)
+            return _json_loads(response) if response.content else None
+
+    @contextmanager
+    def _api_errors(self, call: _ApiCall):
+        """Logs request failures raised inside the block and re-raises them as SDXException.
+
+        Args:
+            call (_ApiCall): Messages and status-code table for the API call being made.
+
+        Raises:
+            SDXException: If the request fails, times out, or returns an HTTP error status.
+        """
+        try:
+            yield
         except HTTPError as e:
-            if e.response is not None:
+            if e.response is None:
+                status_code = None
+                error_message = "Unknown error occurred."
+            elif call.error_from_body:
+                status_code = e.response.status_code
                 try:
-                    error_msg = e.response.json().get("description", "Unknown error")
+                    error_message = _json_loads(e.response).get(
+                        "description", "Unknown error"
+                    )
                 except ValueError:
-                    error_msg = "Error response is not a valid JSON"
-                self._logger.error(
-                    f"Failed to delete L2VPN. Status code: {e.response.status_code}: {error_msg}"
-                )
+                    error_message = "Error response is not a valid JSON"
             else:
-                error_msg = "Unknown error occurred"
-                self._logger.error(f"Failed to delete L2VPN. {error_msg}")
-            raise SDXException(
-                status_code=e.response.status_code if e.response else 500,
-                message=error_msg,
-                method_messages={
-                    201: "L2VPN Deleted",
-                    401: "Not Authorized",
-                    404: "L2VPN Service ID provided does not exist",
-                },
+                status_code = e.response.status_code
+                error_message = call.method_messages.get(
+                    status_code, "Unknown error occurred."
+                )
+            self._logger.error(
+                "%s. Status code: %s: %s", call.failure, status_code, error_message
             )
-        except Timeout:
-            self._logger.error("Request timed out.")
-            raise SDXException("The request to delete the L2VPN timed out.")
+            raise SDXException(
+                status_code=status_code,
+                method_messages=call.method_messages,
+                message=error_message,
+            ) from e
+        except Timeout as e:
+            self._logger.error(call.timeout)
+            raise SDXException(message=call.timeout) from e
         except RequestException as e:
-            self._logger.error(f"Failed to delete L2VPN: {e}")
-            raise SDXException(f"Failed to delete L2VPN: {e}")
+            self._logger.error("%s: %s", call.request_error, e)
+            raise SDXException(message=f"{call.request_error}: {e}") from e
 
     # Utility Methods
     def __str__(self) -> str:
         """Returns a string description of the SDXClient instance."""
         return (
-            f"SDXClient(name={self.name}, endpoints={self.endpoints}, "
-            f"description={self.description}, notifications={self.notifications}, "
-            f"scheduling={self.scheduling}, qos_metrics={self.qos_metrics}, "
-            f"base url={self.base_url}"
+            f"SDXClient(name={self._name}, endpoints={self._endpoints}, "
+            f"description={self._description}, notifications={self._notifications}, "
+            f"scheduling={self._scheduling}, qos_metrics={self._qos_metrics}, "
+            f"base url={self._base_url}"
         )
 
-    def __repr__(self) -> str:
-        """Returns a string representation of the SDXClient instance."""
-        return (
-            f"SDXClient(name={self.name}, endpoints={self.endpoints}, "
-            f"description={self.description}, notifications={self.notifications}, "
-            f"scheduling={self.scheduling}, qos_metrics={self.qos_metrics}, "
-            f"base url={self.base_url}"
-        )
+    __repr__ = __str__
+
+    def __getstate__(self) -> Dict:
+        """Returns the attributes to pickle or deep copy, leaving out the cache lock."""
+        state = {
+            slot: getattr(self, slot) for slot in self.__slots__ if slot != "_cache_lock"
+        }
+        # The shared default session is reattached rather than copied.
+        if state["_session"] is _SESSION:
+            state["_session"] = None
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """Restores pickled or copied attributes with a new cache lock."""
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        self._session = self._session or _SESSION
+        self._cache_lock = threading.Lock()
@@ -1,5 +1,19 @@
+import json
+import sys
+from operator import attrgetter
 from typing import Dict, List, Optional, Union
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+def _intern(value):
+    """Interns string values of low-cardinality fields so large listings share them."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class SDXResponse:
     """
     Class representing a response object from the L2VPN creation API.
@@ -17,6 +31,24 @@ class SDXResponse:
         oxp_service_ids (Optional[List[Dict[str, str]]]): A list of dictionaries containing OXP service IDs.
     """
 
+    __slots__ = (
+        "service_id",
+        "name",
+        "endpoints",
+        "description",
+        "notifications",
+        "qos_metrics",
+        "ownership",
+        "creation_date",
+        "archived_date",
+        "status",
+        "state",
+        "counters_location",
+        "last_modified",
+        "current_path",
+        "oxp_service_ids",
+    )
+
     def __init__(self, response_json: dict):
         """
         Initializes the L2VPNResponse object from a JSON response dictionary.
@@ -33,16 +65,69 @@ class SDXResponse:
         self.description: Optional[str] = response_json.get("description")
         self.notifications: Optional[List[Dict[str, str]]] = response_json.get("notifications")
         self.qos_metrics: Optional[Dict[str, Dict[str, Union[int, bool]]]] = response_json.get("qos_metrics")
-        self.ownership: str = response_json.get("ownership")
+        self.ownership: str = _intern(response_json.get("ownership"))
         self.creation_date: str = response_json.get("creation_date")
         self.archived_date: str = response_json.get("archived_date")
-        self.status: str = response_json.get("status")
-        self.state: str = response_json.get("state")
+        self.status: str = _intern(response_json.get("status"))
+        self.state: str = _intern(response_json.get("state"))
         self.counters_location: str = response_json.get("counters_location")
         self.last_modified: str = response_json.get("last_modified")
         self.current_path: List[str] = response_json.get("current_path")
         self.oxp_service_ids: List[Dict[str, str]] = response_json.get("oxp_service_ids")
 
+    @classmethod
+    def from_bytes(cls, body: Union[bytes, str]) -> "SDXResponse":
+        """
+        Builds an SDXResponse straight from a raw JSON response body.
+
+        Parses with orjson when installed, otherwise with the stdlib json module.
+
+        Args:
+            body (Union[bytes, str]): The JSON response body from the L2VPN API.
+
+        Raises:
+            TypeError: If the body does not decode to a JSON object.
+            ValueError: If the body is not valid JSON.
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+        return cls(loads(body))
+
+    @classmethod
+    def from_wrapped(cls, wrapped: dict) -> "SDXResponse":
+        """
+        Builds an SDXResponse from a body that wraps the L2VPN under its service ID.
+
+        Args:
+            wrapped (dict): A single-entry dictionary, {service_id: response_json}.
+
+        Raises:
+            TypeError: If wrapped is not a dictionary.
+            ValueError: If wrapped does not hold exactly one entry.
+        """
+        if not isinstance(wrapped, dict):
+            raise TypeError("Expected a dictionary wrapping one response_json.")
+        if len(wrapped) != 1:
+            raise ValueError(
+                f"Expected exactly one wrapped L2VPN, got {len(wrapped)}."
+            )
+        return cls(next(iter(wrapped.values())))
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares two responses attribute by attribute.
+        """
+        if not isinstance(other, SDXResponse):
+            return NotImplemented
+        return self is other or _response_key(self) == _response_key(other)
+
+    def __hash__(self) -> int:
+        """
+        Hashes on service_id, the only attribute guaranteed to be hashable.
+
+        Equal responses share a service_id, so this stays consistent with __eq__.
+        """
+        return hash(self.service_id)
+
     def __str__(self) -> str:
         """
         Returns a string representation of the L2VPNResponse object.
@@ -58,3 +143,7 @@ class SDXResponse:
         last_modified: {self.last_modified}
         current_path: {self.current_path}
         oxp_service_ids: {self.oxp_service_ids}"""
+
+
+# Fetches every slot in one C-level call, for __eq__.
+_response_key = attrgetter(*SDXResponse.__slots__)
@@ -0,0 +1,372 @@
+"""Attribute validators for SDXClient.
+
+These functions hold no client state and do not depend on requests, so they
+can be used on their own or compiled separately from the client.
+"""
+from datetime import datetime
+from functools import lru_cache
+import re
+from typing import Dict, Final, List, Optional, Union
+
+PORT_ID_PATTERN: Final = (
+    r"^urn:sdx:port:[a-zA-Z0-9.,-_\/]+:[a-zA-Z0-9.,-_\/]+:[a-zA-Z0-9.,-_\/]+$"
+)
+_PORT_ID_RE: Final = re.compile(PORT_ID_PATTERN)
+_PORT_ID_PREFIX: Final = "urn:sdx:port:"
+
+_SPECIAL_VLANS: Final = frozenset({"any", "all", "untagged"})
+# Canonical spellings of every valid single VLAN ID, "1" through "4095".
+_VLAN_IDS: Final = frozenset(str(vlan_id) for vlan_id in range(1, 4096))
+_SCHED_KEYS: Final = frozenset({"start_time", "end_time"})
+# Sentinel for dict lookups where None is a legitimate (if invalid) value.
+_MISSING: Final = object()
+# Inclusive (min, max) range allowed for each QoS metric value, with the
+# error message raised when a value falls outside it.
+_QOS_RANGES: Final = {
+    key: (low, high, f"qos_metric '{key}' value must be between {low} and {high}.")
+    for key, (low, high) in {
+        "min_bw": (0, 100),
+        "max_delay": (0, 1000),
+        "max_number_oxps": (1, 100),
+    }.items()
+}
+
+
+# Endpoints
+def validate_endpoints(
+    endpoints: Optional[List[Dict[str, str]]]
+) -> List[Dict[str, str]]:
+    """Validates the provided list of endpoints.
+
+    Args:
+        endpoints (Optional[List[Dict[str, str]]]): List of endpoint dictionaries.
+
+    Returns:
+        List[Dict[str, str]]: Validated list of endpoint dictionaries.
+
+    Raises:
+        TypeError: If endpoints is not a list.
+        ValueError: If endpoints list is empty or does not contain at least 2 entries,
+            or if VLAN configuration is invalid.
+    """
+    if endpoints is None:
+        return []
+    if not isinstance(endpoints, list):
+        raise TypeError("Endpoints must be a list.")
+    if len(endpoints) < 2:
+        raise ValueError("Endpoints must contain at least 2 entries.")
+
+    # VLAN kinds seen across endpoints: "all", "any_untagged", "single", "range".
+    vlan_kinds = set()
+    range_vlans = set()
+
+    validated_endpoints = []
+    # Bind the per-endpoint callables to locals once instead of per iteration.
+    check_endpoint = _check_endpoint_dict
+    append_endpoint = validated_endpoints.append
+    add_kind = vlan_kinds.add
+    for endpoint in endpoints:
+        vlan_kind = check_endpoint(endpoint)
+        append_endpoint(endpoint)
+        add_kind(vlan_kind)
+        if vlan_kind == "range":
+            range_vlans.add(endpoint["vlan"])
+
+    # 'all' and ranges must be the one VLAN value shared by every endpoint.
+    if ("all" in vlan_kinds or "range" in vlan_kinds) and (
+        len(vlan_kinds) > 1 or len(range_vlans) > 1
+    ):
+        raise ValueError(
+            "All endpoints must have the same VLAN value if one endpoint is 'all' or a range."
+        )
+
+    return validated_endpoints
+
+
+@lru_cache(maxsize=1024)
+def is_valid_port_id(port_id: str) -> bool:
+    """Checks a port_id against PORT_ID_PATTERN, memoizing the result.
+
+    Batch imports validate the same port_ids many times over, so repeated
+    IDs are answered from the cache instead of rerunning the regex.
+
+    Args:
+        port_id (str): The port_id to validate.
+
+    Returns:
+        bool: True if the port_id is valid, False otherwise.
+    """
+    # The prefix and colon-count checks reject most malformed IDs before the regex
+    # runs. fullmatch, unlike match, does not let '$' accept a trailing newline.
+    return (
+        port_id.startswith(_PORT_ID_PREFIX)
+        and port_id.count(":") >= 5
+        and _PORT_ID_RE.fullmatch(port_id) is not None
+    )
+
+
+def validate_endpoint_dict(endpoint_dict: Dict[str, str]) -> Dict[str, str]:
+    """Validates a single endpoint dictionary.
+
+    Args:
+        endpoint_dict (Dict[str, str]): Endpoint dictionary.
+
+    Returns:
+        Dict[str, str]: Validated endpoint dictionary.
+
+    Raises:
+        TypeError: If endpoint_dict is not a dictionary.
+        ValueError: If endpoint_dict does not contain required keys or VLAN is invalid.
+    """
+    _check_endpoint_dict(endpoint_dict)
+    return endpoint_dict
+
+
+def _check_endpoint_dict(endpoint_dict: Dict[str, str]) -> str:
+    """Validates a single endpoint dictionary and classifies its VLAN.
+
+    Returns:
+        str: The VLAN kind, one of "any_untagged", "all", "single", or "range".
+
+    Raises:
+        TypeError: If endpoint_dict is not a dictionary.
+        ValueError: If endpoint_dict does not contain required keys or VLAN is invalid.
+    """
+    if not isinstance(endpoint_dict, dict):
+        raise TypeError("Endpoints must be a list of dictionaries.")
+
+    # Validate 'port_id'
+    if "port_id" not in endpoint_dict or not endpoint_dict["port_id"]:
+        raise ValueError("Each endpoint must contain a non-empty 'port_id' key.")
+    port_id = endpoint_dict["port_id"]
+    if not isinstance(port_id, str):
+        raise TypeError("port_id must be a string.")
+    if not is_valid_port_id(port_id):
+        raise ValueError(f"Invalid port_id format: {port_id}")
+
+    # Validate 'vlan'
+    if "vlan" not in endpoint_dict or not endpoint_dict["vlan"]:
+        raise ValueError("Each endpoint must contain a non-empty 'vlan' key.")
+    vlan_value = endpoint_dict["vlan"]
+
+    if not isinstance(vlan_value, str):
+        raise TypeError("VLAN must be a string.")
+
+    if vlan_value in _SPECIAL_VLANS:
+        return "all" if vlan_value == "all" else "any_untagged"
+    if vlan_value in _VLAN_IDS:
+        return "single"
+
+    # Other digit strings are out of range or zero-padded, e.g. "0100". isdigit()
+    # alone also accepts non-ASCII digits such as "\u0661\u0660\u0660", which
+    # int() would silently convert to 100; they are rejected on purpose.
+    if vlan_value.isascii() and vlan_value.isdigit():
+        if not (1 <= int(vlan_value) <= 4095):
+            raise ValueError(
+                f"Invalid VLAN value: '{vlan_value}'. Must be between 1 and 4095."
+            )
+        return "single"
+
+    if ":" not in vlan_value:
+        raise ValueError(
+            f"Invalid VLAN value: '{vlan_value}'. Must be 'any', 'all', 'untagged', a string representing an integer between 1 and 4095, or a range."
+        )
+    if vlan_value.count(":") != 1:
+        raise ValueError(
+            f"Invalid VLAN range values: '{vlan_value}'. Must be 'VLAN ID1:VLAN ID2'."
+        )
+    # Both bounds must be plain ASCII digits: unlike int(), this rejects
+    # surrounding whitespace and signs such as " 10:20" or "+5:10".
+    range_start, _, range_end = vlan_value.partition(":")
+    if not (
+        vlan_value.isascii()
+        and range_start.isdigit()
+        and range_end.isdigit()
+        and 1 <= int(range_start) < int(range_end) <= 4095
+    ):
+        raise ValueError(
+            f"Invalid VLAN range format: '{vlan_value}'. Must be 'VLAN ID1:VLAN ID2'."
+        )
+    return "range"
+
+
+# Notifications
+def is_valid_email(email: str) -> bool:
+    """Validates an email address format.
+
+    Args:
+        email (str): Email address to validate.
+
+    Returns:
+        bool: True if the email address is valid, False otherwise.
+    """
+    # Equivalent to a full match of r"\S+@\S+": no whitespace anywhere and an
+    # '@' with at least one character on each side.
+    return (
+        isinstance(email, str)
+        and "@" in email[1:-1]
+        and email.split() == [email]
+    )
+
+
+def validate_notifications(
+    notifications: Optional[List[Dict[str, str]]]
+) -> Optional[List[Dict[str, str]]]:
+    """Validates the notifications attribute.
+
+    Args:
+        notifications (Optional[List[Dict[str, str]]]): List of dictionaries representing notifications.
+
+    Returns:
+        Optional[List[Dict[str, str]]]: Validated list of notifications.
+
+    Raises:
+        TypeError: If notifications is not a list.
+        ValueError: If notifications exceed 10 dictionaries or contain invalid emails.
+    """
+    if notifications is None:
+        return None
+    if not isinstance(notifications, list):
+        raise ValueError("Notifications must be provided as a list.")
+    if len(notifications) > 10:
+        raise ValueError("Notifications can contain at most 10 email addresses.")
+
+    check_email = is_valid_email
+    for notification in notifications:
+        if not isinstance(notification, dict):
+            raise ValueError("Each notification must be a dictionary.")
+        email = notification.get("email", _MISSING)
+        if email is _MISSING:
+            raise ValueError(
+                "Each notification dictionary must contain a key 'email'."
+            )
+        if not check_email(email):
+            raise ValueError(f"Invalid email address or email format: {email}")
+    return notifications
+
+
+def is_valid_iso8601(timestamp: str) -> bool:
+    """Checks if the provided string is a valid ISO8601 formatted timestamp.
+
+    Args:
+        timestamp (str): The timestamp to validate.
+
+    Returns:
+        bool: True if the timestamp is valid, False otherwise.
+    """
+    # Fixed-width YYYY-MM-DDTHH:mm:SSZ, so check separators by position.
+    if not isinstance(timestamp, str) or len(timestamp) != 20:
+        return False
+    if not (
+        timestamp.isascii()
+        and timestamp[4] == timestamp[7] == "-"
+        and timestamp[10] == "T"
+        and timestamp[13] == timestamp[16] == ":"
+        and timestamp[19] == "Z"
+        and timestamp[:4].isdigit()
+        and timestamp[5:7].isdigit()
+        and timestamp[8:10].isdigit()
+        and timestamp[11:13].isdigit()
+        and timestamp[14:16].isdigit()
+        and timestamp[17:19].isdigit()
+    ):
+        return False
+    # The shape is right; let the C datetime parser reject impossible dates
+    # and times such as February 30th or 25:00.
+    try:
+        datetime.fromisoformat(timestamp[:19])
+    except ValueError:
+        return False
+    return True
+
+
+# Scheduling
+def validate_scheduling(
+    scheduling: Optional[Dict[str, str]]
+) -> Optional[Dict[str, str]]:
+    """Validates the provided scheduling configuration.
+
+    Args:
+        scheduling (Optional[Dict[str, str]]): Scheduling configuration.
+
+    Raises:
+        TypeError: If scheduling is not a dictionary and value is not a string.
+        ValueError: If scheduling contains invalid keys or values.
+    """
+    if scheduling is None:
+        return None
+
+    if not isinstance(scheduling, dict):
+        raise TypeError("Scheduling must be a dictionary.")
+
+    for key in scheduling:
+        if key not in _SCHED_KEYS:
+            raise ValueError(f"Invalid scheduling key: {key}")
+
+        time = scheduling[key]
+        if not isinstance(time, str):
+            raise TypeError(f"{key} must be a string.")
+        if not is_valid_iso8601(time):
+            raise ValueError(
+                f"Invalid '{key}' format. Use ISO8601 format (YYYY-MM-DDTHH:mm:SSZ)."
+            )
+
+    if "start_time" in scheduling and "end_time" in scheduling:
+        if scheduling["end_time"] <= scheduling["start_time"]:
+            raise ValueError("End time must be after start time.")
+
+    return scheduling
+
+
+# QoS Metrics
+def validate_qos_metric(
+    qos_metrics: Optional[Dict[str, Dict[str, Union[int, bool]]]]
+) -> None:
+    """Validates the provided quality of service metrics.
+
+    Args:
+        qos_metrics (Optional[Dict[str, Dict[str, Union[int, bool]]]]): Quality of service metrics.
+
+    Raises:
+        TypeError: If qos_metrics is not a dictionary and values are invalid types.
+        ValueError: If qos_metrics contains invalid keys or values.
+    """
+    if qos_metrics is None:
+        return
+
+    if not isinstance(qos_metrics, dict):
+        raise TypeError("QoS metrics must be a dictionary.")
+
+    for key, value_dict in qos_metrics.items():
+        if key not in _QOS_RANGES:
+            raise ValueError(f"Invalid QoS metric: {key}")
+        if not isinstance(value_dict, dict):
+            raise TypeError(f"QoS metric value for '{key}' must be a dictionary.")
+        validate_qos_metric_value(key, value_dict)
+
+
+def validate_qos_metric_value(
+    key: str, value_dict: Dict[str, Union[int, bool]]
+) -> None:
+    """Validates the value dictionary for a specific QoS metric.
+
+    Args:
+        key (str): The key for the Qos Metric.
+        value_dict (Dict[str, Union[int, bool]]): The value dictionary for the QoS metric.
+
+    Raises:
+        ValueError: If the value for the metric is out of the expected range.
+        TypeError: If value or strict values are of incorrect type.
+    """
+    if "value" not in value_dict:
+        raise ValueError(f"Missing required key 'value' in QoS metric for '{key}'")
+    value = value_dict["value"]
+    # bool is a subclass of int, so reject it explicitly.
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TypeError(f"QoS value for '{key}' must be an integer.")
+    if "strict" in value_dict and not isinstance(value_dict["strict"], bool):
+        raise TypeError(f"'strict' in QoS metric of '{key}' must be a boolean.")
+
+    low, high, range_error = _QOS_RANGES[key]
+    if not low <= value <= high:
+        raise ValueError(range_error)
@@ -1,15 +1,19 @@
+import copy
+import json
+import pickle
 import requests
-from requests.exceptions import HTTPError, Timeout, RequestException
+from requests.exceptions import HTTPError, Timeout, RequestException, InvalidJSONError
 import unittest
-from unittest.mock import patch, Mock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, Mock, ANY
 from sdxlib.sdx_client import SDXClient
 from sdxlib.sdx_exception import SDXException
-from test_config import TEST_URL, TEST_NAME, TEST_ENDPOINTS
+from test_config import TEST_URL, TEST_NAME, TEST_ENDPOINTS, create_client
 
 
 class TestSDXClient(unittest.TestCase):
     # # API Call Succeeds
-    @patch("requests.post")
+    @patch("requests.Session.post")
     @patch("logging.getLogger")
     def test_create_l2vpn_success_with_logging(self, mock_get_logger, mock_post):
         """Tests successful L2VPN creation and logging."""
@@ -31,12 +35,17 @@ class TestSDXClient(unittest.TestCase):
         self.assertEqual(response.service_id, "123")
         mock_post.assert_called_once_with(
             f"{TEST_URL}/l2vpn/1.0",
-            json={
+            data=ANY,
+            headers={"Content-Type": "application/json"},
+            timeout=120,
+        )
+        self.assertEqual(
+            json.loads(mock_post.call_args.kwargs["data"]),
+            {
                 "name": TEST_NAME,
                 "endpoints": TEST_ENDPOINTS,
                 "description": "Test Description",
             },
-            timeout=120,
         )
         mock_logger.debug.assert_called_once_with(
             "Sending request to create L2VPN with payload: %s",
@@ -47,17 +56,17 @@ class TestSDXClient(unittest.TestCase):
             },
         )
         mock_logger.info.assert_called_once_with(
-            "L2VPN created successfully with service_id: 123"
+            "L2VPN created successfully with service_id: %s", "123"
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_create_l2vpn_error(self, mock_post):
         """Tests handling of RequestException during L2VPN creation."""
         # Set up mock error
         mock_post.side_effect = requests.exceptions.RequestException("Connection error")
 
         # Create SDXClient object
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
 
         # Call the function and assert it raises SDXException
         with self.assertRaises(SDXException) as context:
@@ -107,7 +116,20 @@ class TestSDXClient(unittest.TestCase):
             client.create_l2vpn()
         self.assertEqual(str(context.exception), "Endpoints must be a list.")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
+    @patch("sdxlib.sdx_client._json_dumps", side_effect=InvalidJSONError("bad payload"))
+    def test_create_l2vpn_unserializable_payload(self, mock_dumps, mock_post):
+        """Tests that a payload serialization failure raises an SDXException."""
+        client = create_client()
+        with self.assertRaises(SDXException) as context:
+            client.create_l2vpn()
+        self.assertEqual(
+            str(context.exception),
+            "An error occurred while creating L2VPN: bad payload",
+        )
+        mock_post.assert_not_called()
+
+    @patch("requests.Session.post")
     def test_create_l2vpn_http_error(self, mock_post):
         """Tests handling of HTTP errors during L2VPN creation."""
         mock_response = Mock()
@@ -117,7 +139,7 @@ class TestSDXClient(unittest.TestCase):
 
         mock_post.return_value = mock_response
 
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS)
+        client = create_client()
         with self.assertRaises(SDXException) as context:
             client.create_l2vpn()
         self.assertEqual(
@@ -125,7 +147,7 @@ class TestSDXClient(unittest.TestCase):
             "Request does not have a valid JSON or body is incomplete/incorrect",
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     @patch("logging.getLogger")
     def test_create_l2vpn_timeout_logging(self, mock_get_logger, mock_post):
         """Tests timeout handling and logging for L2VPN creation."""
@@ -148,7 +170,7 @@ class TestSDXClient(unittest.TestCase):
             "The request to create the L2VPN timed out."
         )
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     @patch("logging.getLogger")
     def test_create_l2vpn_request_exception_logging(self, mock_get_logger, mock_post):
         """Tests general request exception handling and logging for L2VPN creation."""
@@ -169,10 +191,11 @@ class TestSDXClient(unittest.TestCase):
             "An error occurred while creating L2VPN: Connection error",
         )
         mock_logger.error.assert_called_once_with(
-            "An error occurred while creating L2VPN: Connection error"
+            "%s: %s", "An error occurred while creating L2VPN", ANY
         )
+        self.assertEqual(str(mock_logger.error.call_args.args[2]), "Connection error")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_create_l2vpn_caching(self, mock_post):
         """Tests caching mechanism by ensuring a single POST request is made."""
         mock_response = Mock()
@@ -193,6 +216,158 @@ class TestSDXClient(unittest.TestCase):
             mock_post.call_count, 1
         )  # Ensure requests.post was only called once
 
+    @patch("requests.Session.post")
+    def test_create_l2vpn_cache_keyed_on_payload(self, mock_post):
+        """Tests that changing the payload bypasses the cached response."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"service_id": "123"}
+        mock_post.return_value = mock_response
+
+        client = create_client()
+        client.create_l2vpn()
+        client.description = "Changed Description"
+        client.create_l2vpn()
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch("sdxlib.sdx_client._REQUEST_CACHE_MAX", 1)
+    @patch("requests.Session.post")
+    def test_create_l2vpn_cache_evicts_oldest(self, mock_post):
+        """Tests that the request cache is bounded and evicts the oldest entry."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"service_id": "123"}
+        mock_post.return_value = mock_response
+
+        client = create_client()
+        client.create_l2vpn()
+        client.name = "Second L2VPN"
+        client.create_l2vpn()
+        self.assertEqual(len(client._request_cache), 1)
+
+        client.name = TEST_NAME
+        client.create_l2vpn()
+        self.assertEqual(mock_post.call_count, 3)
+
+
+    @patch("sdxlib.sdx_client._REQUEST_CACHE_MAX", 4)
+    def test_request_cache_bounded_under_concurrent_use(self):
+        """Tests that concurrent cache reads and writes keep the cache within its bound."""
+        client = SDXClient(base_url=TEST_URL)
+
+        def churn(worker):
+            for i in range(500):
+                key = f"{worker}-{i}".encode()
+                client._cache_put(key, {"service_id": key})
+                client._cache_get(f"{worker}-{i - 1}".encode())
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(churn, range(8)))
+        self.assertLessEqual(len(client._request_cache), 4)
+
+    @patch("requests.Session.post")
+    def test_create_l2vpn_batch(self, mock_post):
+        """Tests batch creation returns one result per spec in input order."""
+        created = Mock()
+        created.json.return_value = {"service_id": "123"}
+        conflict = Mock()
+        conflict.status_code = 409
+        conflict.raise_for_status.side_effect = HTTPError(response=conflict)
+        mock_post.side_effect = lambda url, data, **kwargs: (
+            conflict if b"Existing L2VPN" in data else created
+        )
+
+        client = SDXClient(base_url=TEST_URL)
+        results = client.create_l2vpn_batch(
+            [
+                {"name": TEST_NAME, "endpoints": TEST_ENDPOINTS},
+                {"name": "Existing L2VPN", "endpoints": TEST_ENDPOINTS},
+            ]
+        )
+        self.assertEqual(results[0].service_id, "123")
+        self.assertIsInstance(results[1], SDXException)
+        self.assertEqual(results[1].status_code, 409)
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch("requests.Session.post")
+    def test_create_l2vpn_batch_validates_specs_before_sending(self, mock_post):
+        """Tests that an invalid spec anywhere in the batch stops it before any POST."""
+        client = SDXClient(base_url=TEST_URL)
+        invalid_specs = [
+            ({"endpoints": TEST_ENDPOINTS}, ValueError),
+            (
+                {
+                    "name": "Bad Endpoints",
+                    "endpoints": [
+                        {"port_id": "bad", "vlan": "100"},
+                        {"port_id": TEST_ENDPOINTS[1]["port_id"], "vlan": "9999"},
+                    ],
+                },
+                ValueError,
+            ),
+            ({"name": TEST_NAME, "endpoints": TEST_ENDPOINTS, "base_url": "http://other"}, ValueError),
+            ({"name": TEST_NAME, "endpoints": TEST_ENDPOINTS, "session": None}, ValueError),
+            ("not a spec", TypeError),
+        ]
+        for invalid_spec, exception in invalid_specs:
+            with self.subTest(spec=invalid_spec):
+                with self.assertRaises(exception):
+                    client.create_l2vpn_batch(
+                        [{"name": TEST_NAME, "endpoints": TEST_ENDPOINTS}, invalid_spec]
+                    )
+        mock_post.assert_not_called()
+
+    @patch("requests.Session.post")
+    def test_create_l2vpn_batch_uses_request_cache(self, mock_post):
+        """Tests that batch specs already created by the client are not resent."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"service_id": "123"}
+        mock_post.return_value = mock_response
+
+        client = create_client()
+        client.create_l2vpn()
+        results = client.create_l2vpn_batch(
+            [
+                {"name": TEST_NAME, "endpoints": TEST_ENDPOINTS},
+                {"name": "Second L2VPN", "endpoints": TEST_ENDPOINTS},
+            ]
+        )
+        self.assertEqual([r.service_id for r in results], ["123", "123"])
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(len(client._request_cache), 2)
+
+    def test_client_deepcopy_and_pickle(self):
+        """Tests that a client can be deep copied and pickled despite its cache lock."""
+        client = create_client()
+        client._request_cache[b"key"] = {"service_id": "123"}
+        for label, duplicate in (
+            ("deepcopy", copy.deepcopy),
+            ("pickle", lambda c: pickle.loads(pickle.dumps(c))),
+        ):
+            with self.subTest(label):
+                clone = duplicate(client)
+                self.assertEqual(str(clone), str(client))
+                self.assertEqual(clone._request_cache, client._request_cache)
+                self.assertIsNot(clone._request_cache, client._request_cache)
+                self.assertIsNot(clone._cache_lock, client._cache_lock)
+                self.assertIs(clone._session, client._session)
+                with clone._cache_lock:
+                    pass
+
+    @patch("requests.Session.post")
+    def test_create_l2vpn_batch_sends_identical_specs_once(self, mock_post):
+        """Tests that identical specs in one batch are created with a single request."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"service_id": "123"}
+        mock_post.return_value = mock_response
+
+        spec = {"name": TEST_NAME, "endpoints": TEST_ENDPOINTS}
+        results = create_client().create_l2vpn_batch(
+            [spec, {"name": "Second L2VPN", "endpoints": TEST_ENDPOINTS}, dict(spec), spec]
+        )
+        self.assertEqual(len(results), 4)
+        self.assertIs(results[0], results[2])
+        self.assertIs(results[0], results[3])
+        self.assertEqual(mock_post.call_count, 2)
+
 
 # Run the tests
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
 import requests
 import unittest
-from unittest.mock import patch, Mock
+import uuid
+from unittest.mock import patch, Mock, ANY
 from sdxlib.sdx_client import SDXClient
 from sdxlib.sdx_exception import SDXException
 from requests.exceptions import HTTPError, Timeout, RequestException
-from test_config import TEST_URL, TEST_NAME, TEST_ENDPOINTS, TEST_SERVICE_ID
+from test_config import TEST_URL, TEST_NAME, TEST_ENDPOINTS, TEST_SERVICE_ID, create_client
 
 
 class TestSDXClient(unittest.TestCase):
@@ -12,7 +13,7 @@ class TestSDXClient(unittest.TestCase):
         self.client = SDXClient(base_url=TEST_URL)
 
     # Successful Deletion
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_l2vpn_success(self, mock_delete):
         """Test successful deletion of an L2VPN."""
         mock_response = Mock()
@@ -22,7 +23,7 @@ class TestSDXClient(unittest.TestCase):
 
         mock_delete.return_value = mock_response
 
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
 
         result = client.delete_l2vpn(TEST_SERVICE_ID)
         self.assertIsNone(result)
@@ -30,8 +31,40 @@ class TestSDXClient(unittest.TestCase):
             f"{TEST_URL}/l2vpn/1.0/{TEST_SERVICE_ID}", verify=True, timeout=120
         )
 
+    @patch("requests.Session.delete")
+    def test_delete_l2vpn_uuid_service_id(self, mock_delete):
+        """Test that a non-str service ID (e.g. a UUID) is formatted into the URL."""
+        mock_response = Mock()
+        mock_response.status_code = 201
+        mock_response.content = ""
+        mock_delete.return_value = mock_response
+
+        service_id = uuid.UUID(int=1)
+        self.assertIsNone(create_client().delete_l2vpn(service_id))
+        mock_delete.assert_called_with(
+            f"{TEST_URL}/l2vpn/1.0/{service_id}", verify=True, timeout=120
+        )
+
+    @patch("requests.Session.get")
+    def test_get_l2vpn_uuid_service_id(self, mock_get):
+        """Test that a wrapped L2VPN is unwrapped when retrieved by a UUID service ID."""
+        service_id = uuid.UUID(int=1)
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            str(service_id): {"service_id": str(service_id), "name": TEST_NAME}
+        }
+        mock_get.return_value = mock_response
+
+        result = create_client().get_l2vpn(service_id)
+        self.assertEqual(result.service_id, str(service_id))
+        self.assertEqual(result.name, TEST_NAME)
+        mock_get.assert_called_with(
+            f"{TEST_URL}/l2vpn/1.0/{service_id}", verify=True, timeout=120
+        )
+
     # Unauthorized error (401)
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_l2vpn_401_error(self, mock_delete):
         """Test handling of 401 error for L2VPN deletion."""
         mock_response = Mock()
@@ -39,13 +72,13 @@ class TestSDXClient(unittest.TestCase):
         mock_response.raise_for_status.side_effect = HTTPError(response=mock_response)
         mock_delete.return_value = mock_response
 
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
 
         with self.assertRaises(SDXException):
             client.delete_l2vpn(TEST_SERVICE_ID)
 
     # Not found error (404)
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_l2vpn_404_error(self, mock_delete):
         """Test handling of 404 error for L2VPN deletion."""
         mock_response = Mock()
@@ -53,13 +86,13 @@ class TestSDXClient(unittest.TestCase):
         mock_response.raise_for_status.side_effect = HTTPError(response=mock_response)
         mock_delete.return_value = mock_response
 
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
 
         with self.assertRaises(SDXException):
             client.delete_l2vpn(TEST_SERVICE_ID)
 
     # Logging success
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     @patch("logging.getLogger")
     def test_delete_l2vpn_logging_success(self, mock_get_logger, mock_delete):
         """Test logging of successful L2VPN deletion."""
@@ -79,11 +112,12 @@ class TestSDXClient(unittest.TestCase):
 
         client.delete_l2vpn(TEST_SERVICE_ID)
         mock_get_logger().info.assert_called_with(
-            f"L2VPN deletion request sent to {TEST_URL}/l2vpn/1.0/{TEST_SERVICE_ID}."
+            "L2VPN deletion request sent to %s.",
+            f"{TEST_URL}/l2vpn/1.0/{TEST_SERVICE_ID}",
         )
 
     # Logging Error Conditions
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     @patch("logging.getLogger")
     def test_delete_l2vpn_logging_error_conditions(self, mock_get_logger, mock_delete):
         """Test logging of error conditions for L2VPN deletion."""
@@ -105,22 +139,27 @@ class TestSDXClient(unittest.TestCase):
         with self.assertRaises(SDXException):
             client.delete_l2vpn(TEST_SERVICE_ID)
         mock_logger.error.assert_called_with(
-            "Failed to delete L2VPN. Status code: 404: Service ID not found"
+            "%s. Status code: %s: %s",
+            "Failed to delete L2VPN",
+            404,
+            "Service ID not found",
         )
 
     # Request exceptions
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_l2vpn_request_exception(self, mock_delete):
         """Test handling of request exceptions during L2VPN deletion."""
-        mock_delete.side_effect = RequestException("Network error")
+        error = RequestException("Network error")
+        mock_delete.side_effect = error
 
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
 
-        with self.assertRaises(SDXException):
+        with self.assertRaises(SDXException) as context:
             client.delete_l2vpn(TEST_SERVICE_ID)
+        self.assertIs(context.exception.__cause__, error)
 
     # Handle no content
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_l2vpn_no_content(self, mock_delete):
         """Test handling of response with no content for L2VPN deletion."""
         mock_response = Mock()
@@ -128,13 +167,13 @@ class TestSDXClient(unittest.TestCase):
         mock_response.content = b""
         mock_delete.return_value = mock_response
 
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
 
         result = client.delete_l2vpn(TEST_SERVICE_ID)
         self.assertIsNone(result)
 
     # Verify Correct Exception Handling for Non-HTTPError Exceptions
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     @patch("logging.getLogger")
     def test_delete_l2vpn_general_request_exception(self, mock_get_logger, mock_delete):
         """Test handling of general RequestException during L2VPN deletion."""
@@ -153,10 +192,11 @@ class TestSDXClient(unittest.TestCase):
         with self.assertRaises(SDXException):
             client.delete_l2vpn(TEST_SERVICE_ID)
 
-        mock_logger.error.assert_called_with("Failed to delete L2VPN: Network error")
+        mock_logger.error.assert_called_with("%s: %s", "Failed to delete L2VPN", ANY)
+        self.assertEqual(str(mock_logger.error.call_args.args[2]), "Network error")
 
     # Ensure Error Messages for All Status Codes
-    @patch("requests.delete")
+    @patch("requests.Session.delete")
     def test_delete_l2vpn_error_messages(self, mock_delete):
         """Test error messages for different status codes during L2VPN deletion."""
         for status_code, expected_message in {
@@ -181,7 +221,7 @@ class TestSDXClient(unittest.TestCase):
 
             self.assertEqual(cm.exception.message, expected_message)
 
-    @patch("requests.delete", side_effect=Timeout)
+    @patch("requests.Session.delete", side_effect=Timeout)
     @patch("logging.getLogger")
     def test_delete_l2vpn_timeout_logging(self, mock_get_logger, mock_delete):
         """Test logging of timeout exception during L2VPN deletion."""
@@ -199,7 +239,7 @@ class TestSDXClient(unittest.TestCase):
             client.delete_l2vpn(TEST_SERVICE_ID)
 
         # Assert that the error was logged
-        mock_logger.error.assert_called_with("Request timed out.")
+        mock_logger.error.assert_called_with("The request to delete the L2VPN timed out.")
 
 
 # Run the tests
@@ -2,6 +2,9 @@ import unittest
 from sdxlib.sdx_client import SDXClient
 from test_config import (
     create_client,
+    endpoint,
+    TEST_PORT_PREFIX,
+    TEST_PORT_ID_2,
     VLAN_100,
     VLAN_200,
     VLAN_ALL,
@@ -20,6 +23,7 @@ from test_config import (
     ERROR_VLAN_RANGE_MISMATCH,
     ERROR_VLAN_INVALID,
     ERROR_VLAN_RANGE_VALUE,
+    ERROR_VLAN_RANGE_PARTS,
 )
 
 
@@ -34,6 +38,10 @@ class TestSDXClient(unittest.TestCase):
             self.client.endpoints = invalid_value
         self.assertEqual(str(context.exception), expected_message)
 
+    def assert_valid_endpoints(self, valid_value):
+        self.client.endpoints = valid_value
+        self.assertEqual(self.client.endpoints, valid_value)
+
     def test_endpoints_list_check(self):
         """Checks that non-list value is not allowed for the 'endpoints' attribute."""
         self.assert_invalid_endpoints(
@@ -70,13 +78,28 @@ class TestSDXClient(unittest.TestCase):
             ERROR_INVALID_PORT_ID_FORMAT,
         )
 
+    def test_endpoints_port_id_missing_segment(self):
+        """Checks that a 'port_id' with the URN prefix but too few segments is rejected."""
+        self.assert_invalid_endpoints(
+            [{"port_id": TEST_PORT_PREFIX, "vlan": "100"}, VLAN_200],
+            f"Invalid port_id format: {TEST_PORT_PREFIX}",
+        )
+
+    def test_endpoints_port_id_trailing_newline(self):
+        """Checks that a 'port_id' followed by a newline is rejected."""
+        port_id = TEST_PORT_ID_2 + "\n"
+        self.assert_invalid_endpoints(
+            [{"port_id": port_id, "vlan": "100"}, VLAN_200],
+            f"Invalid port_id format: {port_id}",
+        )
+
     # Unit Tests for Endpoints[VLAN] Attribute #
     def test_endpoints_missing_vlan_key(self):
         """Checks that each endpoint contains a 'vlan' key."""
         self.assert_invalid_endpoints(
             [
                 VLAN_100,
-                {"port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2"},
+                {"port_id": TEST_PORT_ID_2},
             ],
             ERROR_EMPTY_VLAN_VALUE,
         )
@@ -85,10 +108,7 @@ class TestSDXClient(unittest.TestCase):
         """Checks that each endpoint's 'vlan' key cannot be empty."""
         self.assert_invalid_endpoints(
             [
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name",
-                    "vlan": "",
-                },
+                endpoint("", "test-port_name"),
                 VLAN_200,
             ],
             ERROR_EMPTY_VLAN_VALUE,
@@ -103,178 +123,64 @@ class TestSDXClient(unittest.TestCase):
         """Checks that setting a 'vlan' as an integer raises a ValueError."""
         self.assert_invalid_endpoints(
             [
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name",
-                    "vlan": 100,
-                },
+                endpoint(100, "test-port_name"),
                 VLAN_200,
             ],
             ERROR_INVALID_VLAN_TYPE,
             TypeError,
         )
 
-    # VLAN value "any" #
-    def test_endpoints_vlan_any_single(self):
-        """Checks that setting a VLAN to 'any' for a single endpoint works."""
-        self.client.endpoints = [VLAN_ANY, VLAN_200]
-        self.assertEqual(self.client.endpoints, [VLAN_ANY, VLAN_200])
-
-    def test_endpoints_vlan_any_untagged(self):
-        """Checks that setting VLANs to 'any' and 'untagged' works together."""
-        self.client.endpoints = [VLAN_ANY, VLAN_UNTAGGED]
-        self.assertEqual(self.client.endpoints, [VLAN_ANY, VLAN_UNTAGGED])
-
-    def test_endpoints_vlan_any_multiple(self):
-        """Checks that setting VLAN to 'any' for multiple endpoints works."""
-        self.client.endpoints = [
-            VLAN_ANY,
-            {
-                "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                "vlan": "any",
-            },
-        ]
-        self.assertEqual(
-            self.client.endpoints,
-            [
-                VLAN_ANY,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "any",
-                },
-            ],
-        )
+    # VLAN values "any" and "untagged" #
+    def test_endpoints_vlan_any_untagged_valid(self):
+        """Checks that 'any' and 'untagged' combine with each other and with VLAN IDs."""
+        for vlans in (
+            ("any", "200"),
+            ("any", "untagged"),
+            ("any", "any"),
+            ("any", "200", "any", "300"),
+            ("untagged", "200"),
+            ("untagged", "untagged"),
+            ("untagged", "200", "untagged", "300"),
+        ):
+            with self.subTest(vlans=vlans):
+                self.assert_valid_endpoints(
+                    [
+                        endpoint(vlan, f"test-port_name{index}")
+                        for index, vlan in enumerate(vlans, 1)
+                    ]
+                )
 
-    def test_endpoints_vlan_any_mixed(self):
-        """Checks that setting VLAN to 'any' with other specific VLAN IDs works."""
-        self.client.endpoints = [
-            VLAN_ANY,
-            VLAN_200,
-            {
-                "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name3",
-                "vlan": "any",
-            },
-            {
-                "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name4",
-                "vlan": "300",
-            },
-        ]
-        self.assertEqual(
-            self.client.endpoints,
-            [
-                VLAN_ANY,
-                VLAN_200,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name3",
-                    "vlan": "any",
-                },
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name4",
-                    "vlan": "300",
-                },
-            ],
-        )
-
-    def test_endpoints_vlan_any_invalid_value(self):
-        """Checks that setting an invalid VLAN raises a ValueError."""
+    def test_endpoints_vlan_invalid_value(self):
+        """Checks that an out-of-range VLAN ID raises a ValueError whatever the other VLAN is."""
+        for first_endpoint in (VLAN_ANY, VLAN_UNTAGGED, VLAN_RANGE):
+            with self.subTest(vlan=first_endpoint["vlan"]):
+                self.assert_invalid_endpoints(
+                    [first_endpoint, endpoint("5000")],
+                    ERROR_INVALID_VLAN_VALUE.format("5000"),
+                )
+
+    def test_endpoints_vlan_non_ascii_digits(self):
+        """Checks that VLAN IDs written with non-ASCII digits are rejected.
+
+        Before the str-method VLAN parser these were accepted via int().
+        """
         self.assert_invalid_endpoints(
-            [
-                VLAN_ANY,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "5000",
-                },
-            ],
-            ERROR_INVALID_VLAN_VALUE.format("5000"),
-        )
-
-    # VLAN value "untagged" #
-    def test_endpoints_vlan_untagged_single(self):
-        """Checks that setting a VLAN to 'untagged' for a single endpoint works."""
-        self.client.endpoints = [VLAN_UNTAGGED, VLAN_200]
-        self.assertEqual(self.client.endpoints, [VLAN_UNTAGGED, VLAN_200])
-
-    def test_endpoints_vlan_untagged_multiple(self):
-        """Checks that setting VLAN to 'untagged' for multiple endpoints works."""
-        self.client.endpoints = [
-            VLAN_UNTAGGED,
-            {
-                "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                "vlan": "untagged",
-            },
-        ]
-        self.assertEqual(
-            self.client.endpoints,
-            [
-                VLAN_UNTAGGED,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "untagged",
-                },
-            ],
-        )
-
-    def test_endpoints_vlan_untagged_mixed(self):
-        """Checks that setting VLAN to 'untagged' with other specific VLAN IDs works."""
-        self.client.endpoints = [
-            VLAN_UNTAGGED,
-            VLAN_200,
-            {
-                "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name3",
-                "vlan": "untagged",
-            },
-            {
-                "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name4",
-                "vlan": "300",
-            },
-        ]
-        self.assertEqual(
-            self.client.endpoints,
-            [
-                VLAN_UNTAGGED,
-                VLAN_200,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name3",
-                    "vlan": "untagged",
-                },
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name4",
-                    "vlan": "300",
-                },
-            ],
+            [VLAN_UNTAGGED, endpoint("\u0661\u0660\u0660")],
+            ERROR_VLAN_INVALID.format("\u0661\u0660\u0660"),
         )
-
-    def test_endpoints_vlan_invalid_value(self):
-        """Checks that setting an invalid VLAN raises a ValueError."""
         self.assert_invalid_endpoints(
-            [
-                VLAN_UNTAGGED,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "5000",
-                },
-            ],
-            ERROR_INVALID_VLAN_VALUE.format("5000"),
+            [VLAN_UNTAGGED, endpoint("100:\u0662\u0660\u0660")],
+            ERROR_VLAN_RANGE_VALUE.format("100:\u0662\u0660\u0660"),
         )
 
     # VLAN range #
     def test_endpoints_vlan_range_valid(self):
         """Checks that setting a valid VLAN range works."""
-        self.client.endpoints = [
-            VLAN_RANGE,
-            {
-                "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                "vlan": "100:200",
-            },
-        ]
-        self.assertEqual(
-            self.client.endpoints,
+        self.assert_valid_endpoints(
             [
                 VLAN_RANGE,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "100:200",
-                },
-            ],
+                endpoint("100:200"),
+            ]
         )
 
     def test_endpoints_vlan_range_empty_vlan_value(self):
@@ -282,223 +188,101 @@ class TestSDXClient(unittest.TestCase):
         self.assert_invalid_endpoints(
             [
                 VLAN_RANGE,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "",
-                },
+                endpoint(""),
             ],
             ERROR_EMPTY_VLAN_VALUE,
         )
 
     def test_endpoints_vlan_range_mismatch(self):
-        """Checks that setting a VLAN range for one endpoint and a different range for another raised a ValueError."""
-        self.assert_invalid_endpoints(
-            [
-                VLAN_RANGE,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "200:300",
-                },
-            ],
-            ERROR_VLAN_RANGE_MISMATCH,
-        )
-
-    def test_endpoints_vlan_range_single_endpoint(self):
-        """Checks that setting a VLAN range for one endpoint and a single VLAN for another raises a ValueError."""
+        """Checks that pairing a VLAN range with any other VLAN value raises a ValueError."""
+        for vlan in ("200:300", "300", "any", "untagged", "all"):
+            with self.subTest(vlan=vlan):
+                self.assert_invalid_endpoints(
+                    [VLAN_RANGE, endpoint(vlan)],
+                    ERROR_VLAN_RANGE_MISMATCH,
+                )
+
+    def test_endpoints_vlan_range_mismatch_last_endpoint(self):
+        """Checks that a differing VLAN range on the last of several endpoints raises a ValueError."""
         self.assert_invalid_endpoints(
             [
                 VLAN_RANGE,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "300",
-                },
-            ],
-            ERROR_VLAN_RANGE_MISMATCH,
-        )
-
-    def test_endpoints_vlan_range_invalid_endpoint(self):
-        """Checks that setting a VLAN range for one endpoint and an invlaid value for another raises a ValueError."""
-        self.assert_invalid_endpoints(
-            [
-                VLAN_RANGE,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "invalid value",
-                },
-            ],
-            ERROR_VLAN_INVALID.format("invalid value"),
-        )
-
-    def test_endpoints_vlan_range_and_any(self):
-        """Checks that setting a VLAN range and 'any' raises a ValueError."""
-        self.assert_invalid_endpoints(
-            [
-                VLAN_RANGE,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "any",
-                },
-            ],
-            ERROR_VLAN_RANGE_MISMATCH,
-        )
-
-    def test_endpoints_vlan_range_and_untagged(self):
-        """Checks that setting a VLAN range and 'untagged' raises a ValueError."""
-        self.assert_invalid_endpoints(
-            [
-                VLAN_RANGE,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "untagged",
-                },
-            ],
-            ERROR_VLAN_RANGE_MISMATCH,
-        )
-
-    def test_endpoints_vlan_range_and_all(self):
-        """Checks that setting a VLAN range and 'all' raises a ValueError."""
-        self.assert_invalid_endpoints(
-            [
-                VLAN_RANGE,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "all",
-                },
+                endpoint("100:200"),
+                endpoint("200:300", "test-port_name3"),
             ],
             ERROR_VLAN_RANGE_MISMATCH,
         )
 
     def test_endpoints_vlan_range_invalid_format(self):
-        """Checks that setting an invalid VLAN range raises a ValueError."""
+        """Checks that reversed or out-of-bounds VLAN ranges raise a ValueError."""
+        for vlan_range in ("200:100", "0:200", "4000:4096"):
+            with self.subTest(vlan_range=vlan_range):
+                self.assert_invalid_endpoints(
+                    [endpoint(vlan_range), endpoint(vlan_range)],
+                    ERROR_VLAN_RANGE_VALUE.format(vlan_range),
+                )
+
+    def test_endpoints_vlan_range_wrong_part_count(self):
+        """Checks that a VLAN range with more than two bounds reports its part count."""
         self.assert_invalid_endpoints(
-            [
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "200:100",
-                },
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "200:100",
-                },
-            ],
-            ERROR_VLAN_RANGE_VALUE.format("200:100"),
+            [endpoint("1:2:3"), endpoint("1:2:3")], ERROR_VLAN_RANGE_PARTS.format("1:2:3"),
         )
 
-    def test_endpoints_vlan_range_out_of_bounds_0(self):
-        """Checks that setting a VLAN range out of the lower bound raises a ValueError."""
-        self.assert_invalid_endpoints(
-            [
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "0:200",
-                },
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "0:200",
-                },
-            ],
-            ERROR_VLAN_RANGE_VALUE.format("0:200"),
-        )
-
-    def test_endpoints_vlan_range_out_of_bounds_4096(self):
-        """Checks that setting a VLAN range out of the upper bould raises a ValueError."""
-        self.assert_invalid_endpoints(
-            [
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "4000:4096",
-                },
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "4000:4096",
-                },
-            ],
-            ERROR_VLAN_RANGE_VALUE.format("4000:4096"),
-        )
-
-    def test_endpoints_vlan_range_and_invalid_vlan(self):
-        """Checks that setting a VLAN range and an invalid VLAN value raises a ValueError."""
-        self.assert_invalid_endpoints(
-            [
-                VLAN_RANGE,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "5000",
-                },
-            ],
-            ERROR_INVALID_VLAN_VALUE.format("5000"),
-        )
+    def test_endpoints_vlan_range_whitespace_and_sign(self):
+        """Checks that VLAN range bounds with whitespace or a sign are rejected."""
+        for vlan_range in (" 10:20", "10: 20", "10:20 ", "+5:10", "5:+10"):
+            with self.subTest(vlan_range=vlan_range):
+                self.assert_invalid_endpoints(
+                    [endpoint(vlan_range), endpoint(vlan_range)],
+                    ERROR_VLAN_RANGE_VALUE.format(vlan_range),
+                )
 
     # VLAN value "all" #
     def test_endpoints_vlan_all_valid(self):
         """Checks that setting a VLAN to 'all' for a single endpoint works if all endpoints have 'all'."""
-        self.client.endpoints = [
-            VLAN_ALL,
-            {
-                "port_id": "urn:sdx:port:test-ox_url:test-node_name:test-port_name2",
-                "vlan": "all",
-            },
-        ]
-        self.assertEqual(
-            self.client.endpoints,
+        self.assert_valid_endpoints(
             [
                 VLAN_ALL,
-                {
-                    "port_id": "urn:sdx:port:test-ox_url:test-node_name:test-port_name2",
-                    "vlan": "all",
-                },
-            ],
+                endpoint("all"),
+            ]
         )
 
-    def test_endpoints_vlan_intger(self):
-        """Checks that setting a VLAN to 'all' with other VLAN values raises a ValueError."""
-        self.assert_invalid_endpoints([VLAN_ALL, VLAN_200,], ERROR_VLAN_RANGE_MISMATCH)
-
-    def test_endpoints_vlan_all_any(self):
-        """Checks that setting a VLAN to 'all' with 'any' raises a ValueError."""
-        self.assert_invalid_endpoints(
-            [
-                VLAN_ALL,
-                {
-                    "port_id": "urn:sdx:port:test-ox_url:test-node_name:test-port_name2",
-                    "vlan": "any",
-                },
-            ],
-            ERROR_VLAN_RANGE_MISMATCH,
-        )
-
-    def test_endpoints_vlan_all_untagged(self):
-        """Checks that setting a VLAN to 'all' with 'untagged' raises a ValueError."""
-        self.assert_invalid_endpoints(
-            [
-                VLAN_ALL,
-                {
-                    "port_id": "urn:sdx:port:test-ox_url:test-node_name:test-port_name2",
-                    "vlan": "untagged",
-                },
-            ],
-            ERROR_VLAN_RANGE_MISMATCH,
-        )
+    def test_endpoints_vlan_all_mismatch(self):
+        """Checks that pairing 'all' with any other VLAN value raises a ValueError."""
+        for vlan in ("200", "any", "untagged"):
+            with self.subTest(vlan=vlan):
+                self.assert_invalid_endpoints(
+                    [VLAN_ALL, endpoint(vlan)],
+                    ERROR_VLAN_RANGE_MISMATCH,
+                )
 
     # Other VLAN value tests #
     def test_endpoints_valid_vlan_format(self):
         """Checks that the 'vlan' key follows the required format."""
-        self.assert_invalid_endpoints(
-            [
-                VLAN_100,
-                {
-                    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
-                    "vlan": "invalid_vlan",
-                },
-            ],
-            ERROR_VLAN_INVALID.format("invalid_vlan"),
-        )
+        for first_endpoint, vlan in ((VLAN_100, "invalid_vlan"), (VLAN_RANGE, "invalid value")):
+            with self.subTest(vlan=vlan):
+                self.assert_invalid_endpoints(
+                    [first_endpoint, endpoint(vlan)], ERROR_VLAN_INVALID.format(vlan),
+                )
 
     def test_valid_endpoints(self):
         """Checks that valid endpoints are accepted."""
-        valid_endpoints = [VLAN_100, VLAN_200]
-        self.client.endpoints = valid_endpoints
-        self.assertEqual(self.client.endpoints, valid_endpoints)
+        self.assert_valid_endpoints([VLAN_100, VLAN_200])
+
+    def test_endpoints_reassign_round_trip(self):
+        """Checks that assigning the endpoints getter's value back keeps the endpoints."""
+        self.client.endpoints = [VLAN_100, VLAN_200]
+        self.client.endpoints = self.client.endpoints
+        self.assertEqual(self.client.endpoints, [VLAN_100, VLAN_200])
+
+    def test_endpoints_getter_returns_copy(self):
+        """Checks that edits to the returned endpoints are revalidated when assigned back."""
+        self.client.endpoints = [VLAN_100, VLAN_200]
+        endpoints = self.client.endpoints
+        self.assertIs(type(endpoints), list)
+        endpoints.append(endpoint("9999", "test-port_name3"))
+        self.assertEqual(self.client.endpoints, [VLAN_100, VLAN_200])
+        self.assert_invalid_endpoints(endpoints, ERROR_INVALID_VLAN_VALUE.format("9999"))
 
 
 # Run the tests
@@ -1,18 +1,21 @@
 import requests
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch, Mock
-from sdxlib.sdx_client import SDXClient
+from sdxlib.sdx_client import SDXClient, _default_session
 from sdxlib.sdx_exception import SDXException
 from sdxlib.sdx_response import SDXResponse
 from requests.exceptions import HTTPError, Timeout, RequestException
-from test_config import TEST_URL, TEST_NAME, TEST_ENDPOINTS, TEST_SERVICE_ID
+from test_config import TEST_URL, TEST_NAME, TEST_ENDPOINTS, TEST_SERVICE_ID, create_client
 
 
 class TestSDXClient(unittest.TestCase):
     def setUp(self):
         self.client = SDXClient(base_url=TEST_URL)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_l2vpn_success(self, mock_get_logger, mock_get):
         """Test successful retrieval of an L2VPN."""
@@ -35,10 +38,11 @@ class TestSDXClient(unittest.TestCase):
         self.assertEqual(result.service_id, TEST_SERVICE_ID)
         self.assertEqual(result.name, "Test L2VPN")
         mock_get_logger().info.assert_called_with(
-            f"L2VPN retrieval request sent to {TEST_URL}/l2vpn/1.0/{TEST_SERVICE_ID}."
+            "L2VPN retrieval request sent to %s.",
+            f"{TEST_URL}/l2vpn/1.0/{TEST_SERVICE_ID}",
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_l2vpn_logging_success(self, mock_get_logger, mock_get):
         """Test logging of successful L2VPN retrieval."""
@@ -63,12 +67,12 @@ class TestSDXClient(unittest.TestCase):
         )
 
         client.get_l2vpn(TEST_SERVICE_ID)
-        expected_message = (
-            f"L2VPN retrieval request sent to {TEST_URL}/l2vpn/1.0/{TEST_SERVICE_ID}."
+        expected_url = f"{TEST_URL}/l2vpn/1.0/{TEST_SERVICE_ID}"
+        mock_get_logger().info.assert_called_with(
+            "L2VPN retrieval request sent to %s.", expected_url
         )
-        mock_get_logger().info.assert_called_with(expected_message)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_l2vpn_404_error(self, mock_get):
         """Test handling of 404 error for L2VPN retrieval."""
         mock_response = Mock()
@@ -86,7 +90,7 @@ class TestSDXClient(unittest.TestCase):
         with self.assertRaises(SDXException):
             client.get_l2vpn("invalid_id")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_l2vpn_401_error(self, mock_get):
         """Test handling of 401 error for L2VPN retrieval."""
         mock_response = Mock()
@@ -104,7 +108,7 @@ class TestSDXClient(unittest.TestCase):
         with self.assertRaises(SDXException):
             client.get_l2vpn(TEST_SERVICE_ID)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_l2vpn_logging_404_error(self, mock_get_logger, mock_get):
         """Test logging of 404 error for L2VPN retrieval."""
@@ -126,10 +130,13 @@ class TestSDXClient(unittest.TestCase):
         with self.assertRaises(SDXException):
             client.get_l2vpn("invalid_id")
         mock_get_logger().error.assert_called_with(
-            "Failed to retrieve L2VPN. Status code: 404: Service ID not found"
+            "%s. Status code: %s: %s",
+            "Failed to retrieve L2VPN",
+            404,
+            "Service ID not found",
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_l2vpn_logging_401_error(self, mock_get_logger, mock_get):
         """Test logging of 401 error for L2VPN retrieval."""
@@ -151,18 +158,18 @@ class TestSDXClient(unittest.TestCase):
         with self.assertRaises(SDXException):
             client.get_l2vpn(TEST_SERVICE_ID)
         mock_get_logger().error.assert_called_with(
-            "Failed to retrieve L2VPN. Status code: 401: Not Authorized"
+            "%s. Status code: %s: %s", "Failed to retrieve L2VPN", 401, "Not Authorized"
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_l2vpn_request_exception(self, mock_get):
         """Test handling of request exceptions during L2VPN retrieval."""
         mock_get.side_effect = RequestException("Network error")
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
         with self.assertRaises(SDXException):
             client.get_l2vpn(TEST_SERVICE_ID)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_l2vpn_json_parsing_error(self, mock_get):
         """Test handling of JSON parsing errors during L2VPN retrieval."""
         mock_response = Mock()
@@ -171,12 +178,12 @@ class TestSDXClient(unittest.TestCase):
         mock_response.raise_for_status.side_effect = HTTPError(response=mock_response)
         mock_get.return_value = mock_response
 
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
 
         with self.assertRaises(SDXException):
             client.get_l2vpn(TEST_SERVICE_ID)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_l2vpn_valid_url_construction(self, mock_get):
         """Test valid URL construction for L2VPN retrieval."""
         mock_response = Mock()
@@ -184,13 +191,101 @@ class TestSDXClient(unittest.TestCase):
         mock_response.json.return_value = {}
         mock_get.return_value = mock_response
 
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
 
         client.get_l2vpn(TEST_SERVICE_ID)
         expected_url = f"{TEST_URL}/l2vpn/1.0/{TEST_SERVICE_ID}"
         mock_get.assert_called_with(expected_url, verify=True, timeout=120)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
+    def test_get_l2vpn_url_follows_base_url_change(self, mock_get):
+        """Test that changing base_url updates the URL used for L2VPN retrieval."""
+        mock_get.return_value.json.return_value = {}
+        client = SDXClient(base_url=TEST_URL)
+        client.base_url = "http://example.com"
+
+        client.get_l2vpn(TEST_SERVICE_ID)
+        mock_get.assert_called_with(
+            f"http://example.com/l2vpn/1.0/{TEST_SERVICE_ID}", verify=True, timeout=120
+        )
+
+    def test_get_l2vpn_uses_provided_session(self):
+        """Test that a session passed to the client is used for L2VPN retrieval."""
+        mock_session = Mock()
+        mock_session.get.return_value.json.return_value = {}
+
+        client = SDXClient(base_url=TEST_URL, session=mock_session)
+
+        client.get_l2vpn(TEST_SERVICE_ID)
+        mock_session.get.assert_called_once_with(
+            f"{TEST_URL}/l2vpn/1.0/{TEST_SERVICE_ID}", verify=True, timeout=120
+        )
+
+    @patch("requests.Session.get")
+    def test_get_l2vpn_batch(self, mock_get):
+        """Test batch retrieval returns one result per service ID in input order."""
+        found = Mock()
+        found.json.return_value = {"service_id": TEST_SERVICE_ID}
+        missing = Mock()
+        missing.status_code = 404
+        missing.raise_for_status.side_effect = HTTPError(response=missing)
+        mock_get.side_effect = lambda url, **kwargs: (
+            missing if url.endswith("/missing") else found
+        )
+
+        results = self.client.get_l2vpn_batch([TEST_SERVICE_ID, "missing"])
+
+        self.assertEqual(results[0].service_id, TEST_SERVICE_ID)
+        self.assertIsInstance(results[1], SDXException)
+        self.assertEqual(results[1].status_code, 404)
+
+    def test_default_session_pools_and_retries(self):
+        """Test that the shared default session retries (but not read timeouts), accepts JSON, and accepts gzip bodies."""
+        session = self.client._session
+        adapter = session.get_adapter(f"{TEST_URL}/l2vpn/1.0")
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIs(adapter.max_retries.read, False)
+        self.assertEqual(session.headers["Accept"], "application/json")
+        self.assertIn("gzip", session.headers["Accept-Encoding"])
+
+    def test_default_session_read_timeout_not_retried(self):
+        """Test that a read timeout on the default session maps to the timeout SDXException."""
+
+        class SlowHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                time.sleep(1)
+                self.send_response(200)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        session = _default_session()
+        session_get = session.get
+        session.get = lambda url, **kwargs: session_get(url, **{**kwargs, "timeout": 0.2})
+        client = SDXClient(base_url=f"http://127.0.0.1:{server.server_port}", session=session)
+
+        started = time.monotonic()
+        with self.assertRaises(SDXException) as context:
+            client.get_l2vpn(TEST_SERVICE_ID)
+        self.assertEqual(
+            str(context.exception), "The request to retrieve the L2VPN timed out."
+        )
+        self.assertIsInstance(context.exception.__cause__, Timeout)
+        self.assertLess(time.monotonic() - started, 0.9)
+
+    def test_default_session_shared_between_clients(self):
+        """Test that clients without their own session reuse one connection pool."""
+        other = SDXClient(base_url=TEST_URL)
+        self.assertIs(other._session, self.client._session)
+
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_all_l2vpns_active(self, mock_get_logger, mock_get):
         """Test retrieving active L2VPNs."""
@@ -214,17 +309,17 @@ class TestSDXClient(unittest.TestCase):
 
 #         client = SDXClient("{'8344657b-2466-4735-9a21-143643073865': {'service_id': '8344657b-2466-4735-9a21-143643073865', 'ownership': 'user1', 'creation_date': '20240522T00:00:00Z', 'archived_date': '0', 'status': 'up', 'state': 'enabled', 'counters_location': 'https://my.aw-sdx.net/l2vpn/7cdf23e8978c', 'last_modified': '0', 'current_path': ['urn:sdx:link:tenet.ac.za:LinkToAmpath'], 'oxp_service_ids': {'ampath.net': ['c73da8e1'], 'Tenet.ac.za': ['5d034620']}}}"
 # )     
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS)
+        client = create_client()
 
         result = client.get_all_l2vpns(archived=False)
         
         self.assertEqual(result, {service_id: SDXResponse(data) for service_id, data in mock_response.json.return_value.items()})
         # self.assertEqual(result, mock_response.json.return_value)
         mock_get_logger().info.assert_called_with(
-            "Retrieved L2VPNs successfully: {'8344657b-2466-4735-9a21-143643073865': {'service_id': '8344657b-2466-4735-9a21-143643073865', 'ownership': 'user1', 'creation_date': '20240522T00:00:00Z', 'archived_date': '0', 'status': 'up', 'state': 'enabled', 'counters_location': 'https://my.aw-sdx.net/l2vpn/7cdf23e8978c', 'last_modified': '0', 'current_path': ['urn:sdx:link:tenet.ac.za:LinkToAmpath'], 'oxp_service_ids': {'ampath.net': ['c73da8e1'], 'Tenet.ac.za': ['5d034620']}}}"
+            "Retrieved L2VPNs successfully: %s", mock_response.json.return_value
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_all_l2vpns_archived(self, mock_get_logger, mock_get):
         """Test retrieving archived L2VPNs."""
@@ -238,16 +333,16 @@ class TestSDXClient(unittest.TestCase):
             }
         }
         mock_get.return_value = mock_response
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
         result = client.get_all_l2vpns(archived=True)
         expected_result = {service_id: SDXResponse(data) for service_id, data in mock_response.json.return_value.items()}
         self.assertEqual(result, expected_result)
         # self.assertEqual(result, mock_response.json.return_value)
         mock_get_logger().info.assert_called_with(
-            "Retrieved L2VPNs successfully: {'8344657b-2466-4735-9a21-143643073865': {'service_id': '8344657b-2466-4735-9a21-143643073865', 'archived_date': '20240101T00:00:00Z'}}"
+            "Retrieved L2VPNs successfully: %s", mock_response.json.return_value
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_all_l2vpns_logging_retrieval(self, mock_get_logger, mock_get):
         """Test logging of L2VPN retrieval."""
@@ -257,13 +352,13 @@ class TestSDXClient(unittest.TestCase):
             TEST_SERVICE_ID: {"service_id": TEST_SERVICE_ID, "archived_date": "0",}
         }
         mock_get.return_value = mock_response
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
         client.get_all_l2vpns()
         mock_get_logger().info.assert_called_with(
-            "Retrieved L2VPNs successfully: {'8344657b-2466-4735-9a21-143643073865': {'service_id': '8344657b-2466-4735-9a21-143643073865', 'archived_date': '0'}}"
+            "Retrieved L2VPNs successfully: %s", mock_response.json.return_value
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_all_l2vpns_empty_list(self, mock_get):
         """Test handling of empty L2VPN list."""
         mock_response = Mock()
@@ -271,22 +366,47 @@ class TestSDXClient(unittest.TestCase):
         mock_response.json.return_value = {}
         mock_get.return_value = mock_response
 
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
 
         result = client.get_all_l2vpns()
         self.assertEqual(result, {})
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
+    def test_get_all_l2vpns_empty_body(self, mock_get):
+        """Test that an empty response body is treated as no L2VPNs."""
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b""
+        mock_get.return_value = response
+
+        self.assertEqual(self.client.get_all_l2vpns(), {})
+
+    @patch("requests.Session.get")
+    def test_get_all_l2vpns_decodes_raw_body(self, mock_get):
+        """Test that L2VPNs are decoded from the raw response bytes."""
+        response = requests.Response()
+        response.status_code = 200
+        response._content = (
+            b'{"%s": {"service_id": "%s", "name": "Test L2VPN"}}'
+            % (TEST_SERVICE_ID.encode(), TEST_SERVICE_ID.encode())
+        )
+        mock_get.return_value = response
+
+        result = self.client.get_all_l2vpns()
+        self.assertEqual(result[TEST_SERVICE_ID].service_id, TEST_SERVICE_ID)
+        self.assertEqual(result[TEST_SERVICE_ID].name, "Test L2VPN")
+
+    @patch("requests.Session.get")
     def test_get_all_l2vpns_request_exception(self, mock_get):
         """Test handling of request exceptions during L2VPN retrieval."""
         mock_get.side_effect = RequestException("Network error")
 
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
 
         with self.assertRaises(SDXException):
             client.get_all_l2vpns()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch("logging.getLogger")
     def test_get_all_l2vpns_logging_error_conditions(self, mock_get_logger, mock_get):
         """Test logging of error conditions for retrieving L2VPNs."""
@@ -295,15 +415,18 @@ class TestSDXClient(unittest.TestCase):
         mock_response.raise_for_status.side_effect = HTTPError(response=mock_response)
         mock_get.return_value = mock_response
 
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
 
         with self.assertRaises(SDXException):
             client.get_all_l2vpns(archived=True)
         mock_get_logger().error.assert_called_with(
-            "Failed to retrieve L2VPNs. Status code: 404: Unknown error occurred."
+            "%s. Status code: %s: %s",
+            "Failed to retrieve L2VPNs",
+            404,
+            "Unknown error occurred.",
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_all_l2vpns_empty_json_response(self, mock_get):
         """Test handling of empty JSON response for retrieving all L2VPN"""
         mock_response = Mock()
@@ -311,7 +434,7 @@ class TestSDXClient(unittest.TestCase):
         mock_response.json.return_value = {}
         mock_get.return_value = mock_response
 
-        client = SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS,)
+        client = create_client()
 
         result = client.get_all_l2vpns()
         self.assertEqual(result, {})
@@ -68,6 +68,15 @@ class TestSDXClient(unittest.TestCase):
             invalid_notifications, ERROR_NOTIFICATION_INVALID_EMAIL_FORMAT
         )
 
+    def test_is_valid_email_edge_cases(self):
+        """Test email validation around the '@' position and embedded whitespace."""
+        for email in ("a@b", "@a@b", "a@b@", "user1@email.com"):
+            with self.subTest(email=email):
+                self.assertTrue(SDXClient.is_valid_email(email))
+        for email in ("@", "a@", "@b", "a @b", "a@b\n", "", None, 42):
+            with self.subTest(email=email):
+                self.assertFalse(SDXClient.is_valid_email(email))
+
     def test_notifications_list_too_long(self):
         """Test setting notifications exceeding 10-email limit, expecting a ValueError."""
         exceeding_notifications = [{"email": f"user{i}@email.com"} for i in range(11)]
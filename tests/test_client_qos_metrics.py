@@ -46,6 +46,20 @@ class TestSDXClient(unittest.TestCase):
             invalid_value, "qos_metric 'min_bw' value must be between 0 and 100."
         )
 
+    def test_qos_metrics_max_number_oxps_out_of_range(self):
+        """Test setting max_number_oxps below its minimum of 1"""
+        invalid_value = {"max_number_oxps": {"value": 0}}
+        self.assert_invalid_qos_metrics(
+            invalid_value, "qos_metric 'max_number_oxps' value must be between 1 and 100."
+        )
+
+    def test_qos_metrics_bool_value(self):
+        """Test setting a QoS value to a boolean instead of an integer"""
+        invalid_value = {"min_bw": {"value": True}}
+        self.assert_invalid_qos_metrics(
+            invalid_value, "QoS value for 'min_bw' must be an integer.", TypeError
+        )
+
 
 # Run the tests
 if __name__ == "__main__":
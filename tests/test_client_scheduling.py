@@ -48,6 +48,14 @@ class TestSDXClientScheduling(unittest.TestCase):
             invalid_scheduling, ERROR_SCHEDULING_FORMAT,
         )
 
+    def test_invalid_scheduling_impossible_date(self):
+        """Tests that well-formed but impossible timestamps are rejected."""
+        for timestamp in ("2024-02-30T10:00:00Z", "2024-07-04T25:00:00Z"):
+            with self.subTest(timestamp=timestamp):
+                self.assert_invalid_scheduling(
+                    {"start_time": timestamp}, ERROR_SCHEDULING_FORMAT,
+                )
+
     def test_invalid_scheduling_end_before_start(self):
         """Tests invalid scheduling where end_time is before start_time."""
         invalid_scheduling = {
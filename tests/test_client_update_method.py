@@ -1,7 +1,9 @@
+import json
 import requests
-from requests.exceptions import HTTPError, Timeout, RequestException
+from requests.exceptions import HTTPError, Timeout, RequestException, InvalidJSONError
 import unittest
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, ANY
+from sdxlib import sdx_client
 from sdxlib.sdx_client import SDXClient
 from sdxlib.sdx_exception import SDXException
 from test_config import TEST_URL, TEST_NAME, TEST_ENDPOINTS, TEST_SERVICE_ID
@@ -12,7 +14,7 @@ class TestSDXClient(unittest.TestCase):
         self.client = SDXClient(base_url=TEST_URL)
 
     ## Test successful L2VPN update
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_successful_l2vpn_update(self, mock_patch):
         """Test that a valid update request is successful."""
         mock_response = Mock()
@@ -46,7 +48,7 @@ class TestSDXClient(unittest.TestCase):
         mock_patch.assert_called_once()
 
     ## Test Update with Invalid JSON or Incomplete Body: 400 error code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_invalid_json_or_incomplete_body(self, mock_patch):
         """Test that an invalid JSON or incomplete body results in a 400 error."""
         mock_response = Mock()
@@ -58,7 +60,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
     ## Test Unauthorized Update: 401 error code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_unauthorized_update(self, mock_patch):
         """Test that an unauthorized update results in a 401 error."""
         mock_response = Mock()
@@ -70,7 +72,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
     ## Test Update with Incompatible Request: 402 error code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_incompatible_request(self, mock_patch):
         """Test that an incompatible request results in a 402 error."""
         mock_response = Mock()
@@ -82,7 +84,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
     ## Test Update of Non-Existing L2VPN: 404 error code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_non_existing_l2vpn(self, mock_patch):
         """Test that updating a non-existing L2VPN results in a 404 error."""
         mock_response = Mock()
@@ -94,7 +96,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
     ## Test Update with Conflicting L2VPN: 409 error code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_conflicting_l2vpn(self, mock_patch):
         """Test that an update with a conflicting L2VPN results in a 409 error."""
         mock_response = Mock()
@@ -106,7 +108,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
     ## Test Update of Archived L2VPN: 410 status code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_archived_l2vpn(self, mock_patch):
         """Test that updating an archived L2VPN results in a 410 status code."""
         mock_response = Mock()
@@ -118,7 +120,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
     ## Test Update with QoS Requirements Not Fulfilled: 410 error code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_qos_requirements_not_fulfilled(self, mock_patch):
         """Test that unfulfilled QoS requirements result in a 410 error."""
         mock_response = Mock()
@@ -130,7 +132,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
     ## Test Update with Scheduling Not Possible: 411 error code
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_scheduling_not_possible(self, mock_patch):
         """Test that scheduling not possible results in a 411 error."""
         mock_response = Mock()
@@ -154,7 +156,7 @@ class TestSDXClient(unittest.TestCase):
         mock_logger.info.assert_called_once_with("Test log message")
 
     @patch("logging.getLogger")
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_logging_successful_update(self, mock_patch, mock_get_logger):
         """Test that a successful update logs an info message."""
 
@@ -181,20 +183,22 @@ class TestSDXClient(unittest.TestCase):
 
         expected_payload = {"service_id": TEST_SERVICE_ID, "state": "enabled"}
 
-        # Construct the expected log messages
-        expected_request_log = f"L2VPN update request sent to {expected_url}, with payload: {expected_payload}."
-        expected_success_log = f"L2VPN with service_id {TEST_SERVICE_ID} was successfully updated."
-
         # Assert that both log messages were logged
-        mock_logger.info.assert_any_call(expected_request_log)
-        mock_logger.info.assert_any_call(expected_success_log)
+        mock_logger.info.assert_any_call(
+            "L2VPN update request sent to %s, with payload: %s.",
+            expected_url,
+            expected_payload,
+        )
+        mock_logger.info.assert_any_call(
+            "L2VPN with service_id %s was successfully updated.", TEST_SERVICE_ID
+        )
 
         # Assert that both log calls occurred (i.e., two info calls were made)
         self.assertEqual(mock_logger.info.call_count, 2)
 
     ## Test Logging for Update Errors
     @patch("logging.getLogger")
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_logging_update_errors(self, mock_patch, mock_get_logger):
         """Test that update errors are logged as error messages."""
         mock_response = Mock()
@@ -215,8 +219,12 @@ class TestSDXClient(unittest.TestCase):
         with self.assertRaises(SDXException):
             client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
-        expected_message = "Failed to update L2VPN. Status code: 400: Request does not have a valid JSON or body is incomplete/incorrect"
-        mock_logger.error.assert_called_with(expected_message)
+        mock_logger.error.assert_called_with(
+            "%s. Status code: %s: %s",
+            "Failed to update L2VPN",
+            400,
+            "Request does not have a valid JSON or body is incomplete/incorrect",
+        )
 
     ## Test Handling of Invalid 'state' Values
     def test_invalid_state_values(self):
@@ -225,7 +233,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="invalid")
 
     ## Test Update with Valid 'state' Values
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_valid_state_values(self, mock_patch):
         """Test that valid 'state' values are processed correctly."""
         mock_response = Mock()
@@ -244,7 +252,7 @@ class TestSDXClient(unittest.TestCase):
             self.client.update_l2vpn()
 
     ## Test Empty Payload
-    @patch("requests.patch")
+    @patch("requests.Session.patch")
     def test_empty_payload(self, mock_patch):
         """Test that an empty payload still sends a correct request."""
         mock_response = Mock()
@@ -256,24 +264,95 @@ class TestSDXClient(unittest.TestCase):
         expected_payload = {"service_id": TEST_SERVICE_ID}
         mock_patch.assert_called_once_with(
             f"{TEST_URL}/l2vpn/1.0/{TEST_SERVICE_ID}",
-            json=expected_payload,
+            data=ANY,
+            headers={"Content-Type": "application/json"},
             verify=True,
             timeout=120,
         )
+        self.assertEqual(
+            json.loads(mock_patch.call_args.kwargs["data"]), expected_payload
+        )
 
     ## Test Handling of Timeout and RequestException
-    @patch("requests.patch", side_effect=Timeout)
+    @patch("requests.Session.patch", side_effect=Timeout)
     def test_timeout_exception(self, mock_patch):
         """Test that a Timeout exception raises an SDXException."""
         with self.assertRaises(SDXException):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
-    @patch("requests.patch", side_effect=RequestException("Connection error"))
+    @patch("requests.Session.patch", side_effect=RequestException("Connection error"))
     def test_request_exception(self, mock_patch):
         """Test that a RequestException raises an SDXException."""
         with self.assertRaises(SDXException):
             self.client.update_l2vpn(service_id=TEST_SERVICE_ID, state="enabled")
 
+    @patch("requests.Session.patch")
+    def test_unserializable_payload(self, mock_patch):
+        """Test that a payload that cannot be serialized raises an SDXException."""
+        with self.assertRaises(SDXException) as context:
+            self.client.update_l2vpn(
+                service_id=TEST_SERVICE_ID, qos_metrics={"min_bw": {"value": object()}}
+            )
+        self.assertIsInstance(context.exception.__cause__, InvalidJSONError)
+        mock_patch.assert_not_called()
+
+    @unittest.skipIf(sdx_client.orjson is None, "orjson is not installed")
+    @patch("requests.Session.patch")
+    def test_non_finite_payload(self, mock_patch):
+        """Test that NaN and infinite values are rejected with and without orjson."""
+        for label, json_module in (("orjson", sdx_client.orjson), ("json", None)):
+            for value in (float("nan"), float("inf"), -float("inf")):
+                with self.subTest(label, value=value), patch.object(
+                    sdx_client, "orjson", json_module
+                ):
+                    with self.assertRaises(SDXException) as context:
+                        self.client.update_l2vpn(
+                            service_id=TEST_SERVICE_ID,
+                            qos_metrics={"min_bw": {"value": value}},
+                        )
+                    self.assertIsInstance(context.exception.__cause__, InvalidJSONError)
+        mock_patch.assert_not_called()
+
+    @patch("requests.Session.patch")
+    def test_update_l2vpn_batch(self, mock_patch):
+        """Test that batch updates return one result per update in input order."""
+        modified = Mock()
+        modified.status_code = 201
+        not_found = Mock()
+        not_found.status_code = 404
+        not_found.raise_for_status.side_effect = HTTPError(response=not_found)
+        mock_patch.side_effect = lambda url, **kwargs: (
+            not_found if url.endswith("missing") else modified
+        )
+
+        results = self.client.update_l2vpn_batch(
+            [
+                {"service_id": TEST_SERVICE_ID, "state": "disabled"},
+                {"service_id": "missing", "state": "enabled"},
+            ]
+        )
+        self.assertEqual(results[0].service_id, TEST_SERVICE_ID)
+        self.assertIsInstance(results[1], SDXException)
+        self.assertEqual(results[1].status_code, 404)
+        self.assertEqual(mock_patch.call_count, 2)
+
+    @patch("requests.Session.patch")
+    def test_update_l2vpn_batch_validates_updates_before_sending(self, mock_patch):
+        """Test that one invalid update rejects the batch before any request is sent."""
+        valid = {"service_id": TEST_SERVICE_ID, "state": "enabled"}
+        cases = [
+            ("state", {"service_id": "b", "state": "bogus"}, ValueError),
+            ("non-str state", {"service_id": "b", "state": 1}, ValueError),
+            ("missing service_id", {"state": "enabled"}, ValueError),
+            ("unknown key", {"service_id": "b", "bandwidth": 10}, ValueError),
+            ("not a dict", ["b", "enabled"], TypeError),
+        ]
+        for label, invalid, exception in cases:
+            with self.subTest(label):
+                with self.assertRaises(exception):
+                    self.client.update_l2vpn_batch([valid, invalid, valid])
+        mock_patch.assert_not_called()
+
 
 # Run the tests
 if __name__ == "__main__":
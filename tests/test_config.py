@@ -2,41 +2,55 @@ from sdxlib.sdx_client import SDXClient
 
 TEST_URL = "http://aw-sdx-controller.renci.org:8081"
 TEST_NAME = "Test L2VPN"
+# Port IDs shared by the endpoint fixtures below; TEST_PORT_PREFIX alone is
+# one segment short of a valid port_id.
+TEST_PORT_PREFIX = "urn:sdx:port:test-oxp_url:test-node_name"
+TEST_PORT_ID = f"{TEST_PORT_PREFIX}:test-port_name"
+TEST_PORT_ID_2 = f"{TEST_PORT_PREFIX}:test-port_name2"
 TEST_ENDPOINTS = [
     {
-        "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name",
+        "port_id": TEST_PORT_ID,
         "vlan": "100",
     },
     {
-        "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
+        "port_id": TEST_PORT_ID_2,
         "vlan": "200",
     },
 ]
 VLAN_100 = {
-    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name",
+    "port_id": TEST_PORT_ID,
     "vlan": "100",
 }
 VLAN_200 = {
-    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
+    "port_id": TEST_PORT_ID_2,
     "vlan": "200",
 }
 VLAN_ANY = {
-    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name",
+    "port_id": TEST_PORT_ID,
     "vlan": "any",
 }
 VLAN_ALL = {
-    "port_id": "urn:sdx:port:test-ox_url:test-node_name:test-port_name",
+    "port_id": TEST_PORT_ID,
     "vlan": "all",
 }
 VLAN_RANGE = {
-    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name",
+    "port_id": TEST_PORT_ID,
     "vlan": "100:200",
 }
 VLAN_UNTAGGED = {
-    "port_id": "urn:sdx:port:test-oxp_url:test-node_name:test-port_name2",
+    "port_id": TEST_PORT_ID_2,
     "vlan": "untagged",
 }
 
+
+def endpoint(vlan, port_name="test-port_name2"):
+    """Builds a fresh endpoint dictionary on a test-oxp_url port."""
+    return {
+        "port_id": f"{TEST_PORT_PREFIX}:{port_name}",
+        "vlan": vlan,
+    }
+
+
 TEST_SERVICE_ID = "8344657b-2466-4735-9a21-143643073865"
 
 # Name error message.
@@ -57,6 +71,7 @@ ERROR_VLAN_RANGE_MISMATCH = (
 )
 ERROR_VLAN_INVALID = "Invalid VLAN value: '{}'. Must be 'any', 'all', 'untagged', a string representing an integer between 1 and 4095, or a range."
 ERROR_VLAN_RANGE_VALUE = "Invalid VLAN range format: '{}'. Must be 'VLAN ID1:VLAN ID2'."
+ERROR_VLAN_RANGE_PARTS = "Invalid VLAN range values: '{}'. Must be 'VLAN ID1:VLAN ID2'."
 
 # Description error messages
 ERROR_DESCRIPTION_TOO_LONG = "Description attribute must be less than 256 characters."
@@ -91,4 +106,12 @@ def create_client(
     scheduling=None,
     qos_metrics=None,
 ):
-    return SDXClient(base_url=TEST_URL, name=TEST_NAME, endpoints=TEST_ENDPOINTS)
+    return SDXClient(
+        base_url=base_url,
+        name=name,
+        endpoints=endpoints,
+        description=description,
+        notifications=notifications,
+        scheduling=scheduling,
+        qos_metrics=qos_metrics,
+    )
@@ -56,3 +56,52 @@ class SDXResponseTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             SDXResponse(response_json)
 
+    def test_response_from_bytes(self):
+        response = SDXResponse.from_bytes(
+            b'{"service_id": "%s", "status": "up"}' % TEST_SERVICE_ID.encode()
+        )
+        self.assertEqual(response.service_id, TEST_SERVICE_ID)
+        self.assertEqual(response.status, "up")
+        self.assertIsNone(response.state)
+
+    def test_response_from_bytes_with_non_object_body(self):
+        with self.assertRaises(TypeError):
+            SDXResponse.from_bytes(b'["not", "an", "object"]')
+        with self.assertRaises(ValueError):
+            SDXResponse.from_bytes(b"not json")
+
+    def test_response_equality_and_hash(self):
+        response_json = {"service_id": TEST_SERVICE_ID, "current_path": ["a", "b"]}
+        response = SDXResponse(response_json)
+        same = SDXResponse(dict(response_json))
+        other = SDXResponse({"service_id": TEST_SERVICE_ID, "current_path": ["a"]})
+        self.assertEqual(response, same)
+        self.assertNotEqual(response, other)
+        self.assertNotEqual(response, response_json)
+        self.assertEqual(len({response, same, other}), 2)
+
+    def test_response_interns_status_fields(self):
+        first = SDXResponse({"status": "".join(["u", "p"]), "state": "enabled"})
+        second = SDXResponse({"status": "".join(["u", "p"]), "state": None})
+        self.assertIs(first.status, second.status)
+        self.assertIsNone(second.state)
+
+    def test_response_from_wrapped(self):
+        response = SDXResponse.from_wrapped(
+            {TEST_SERVICE_ID: {"service_id": TEST_SERVICE_ID, "status": "up"}}
+        )
+        self.assertEqual(response.service_id, TEST_SERVICE_ID)
+        self.assertEqual(response.status, "up")
+
+    def test_response_from_wrapped_requires_single_entry(self):
+        with self.assertRaises(ValueError):
+            SDXResponse.from_wrapped({})
+        with self.assertRaises(ValueError):
+            SDXResponse.from_wrapped(
+                {
+                    TEST_SERVICE_ID: {"service_id": TEST_SERVICE_ID},
+                    "other": {"service_id": "other"},
+                }
+            )
+        with self.assertRaises(TypeError):
+            SDXResponse.from_wrapped([{"service_id": TEST_SERVICE_ID}])